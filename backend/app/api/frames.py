@@ -11,9 +11,13 @@ from ..dependencies import get_current_user, get_db
 from ..limiter import limiter
 from ..models import CanvasSession, SavedFrame, User
 from ..schemas import (
+    FrameCompleteBatchRequest,
+    FrameCompleteBatchResponse,
     FrameCompleteResponse,
     FrameOut,
     FramesPage,
+    FrameUploadUrlBatchRequest,
+    FrameUploadUrlBatchResponse,
     FrameUploadUrlRequest,
     FrameUploadUrlResponse,
 )
@@ -23,19 +27,22 @@ from ..services.storage import storage_service
 
 router = APIRouter(prefix="/frames", tags=["frames"])
 
+_CONTENT_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "webp": "image/webp",
+}
 
-@router.post(
-    "/upload-url",
-    response_model=FrameUploadUrlResponse,
-    status_code=status.HTTP_201_CREATED,
-)
-@limiter.limit("120/minute")
-def create_upload_url(
-    request: Request,
-    payload: FrameUploadUrlRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+
+def _content_type(extension: str, default: str) -> str:
+    return _CONTENT_TYPES.get(extension.strip(".").lower(), default)
+
+
+def _issue_upload_url(
+    db: Session, current_user: User, payload: FrameUploadUrlRequest
 ) -> FrameUploadUrlResponse:
+    """Create the frame row and signed URLs; the caller commits."""
     session_id = payload.session_id
     if session_id is not None:
         session = db.get(CanvasSession, session_id)
@@ -70,27 +77,56 @@ def create_upload_url(
             "shape_mode": payload.shape_mode,
         },
     )
-    db.commit()
-    db.refresh(frame)
-
     return FrameUploadUrlResponse(
         frame_id=frame.id,
         frame_object_key=frame_key,
         thumbnail_object_key=thumb_key,
-        frame_upload_url=storage_service.generate_upload_url(frame_key, "image/png"),
-        thumbnail_upload_url=storage_service.generate_upload_url(thumb_key, "image/jpeg"),
+        frame_upload_url=storage_service.generate_upload_url(
+            frame_key, _content_type(payload.frame_extension, "image/png")
+        ),
+        thumbnail_upload_url=storage_service.generate_upload_url(
+            thumb_key, _content_type(payload.thumbnail_extension, "image/jpeg")
+        ),
         expires_in=settings.signed_url_ttl_seconds,
     )
 
 
-@router.post("/{frame_id}/complete", response_model=FrameCompleteResponse)
-@limiter.limit("180/minute")
-def complete_upload(
+@router.post(
+    "/upload-url",
+    response_model=FrameUploadUrlResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+@limiter.limit("120/minute")
+def create_upload_url(
     request: Request,
-    frame_id: uuid.UUID,
+    payload: FrameUploadUrlRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> FrameCompleteResponse:
+) -> FrameUploadUrlResponse:
+    response = _issue_upload_url(db, current_user, payload)
+    db.commit()
+    return response
+
+
+@router.post(
+    "/upload-url/batch",
+    response_model=FrameUploadUrlBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+@limiter.limit("30/minute")
+def create_upload_urls_batch(
+    request: Request,
+    payload: FrameUploadUrlBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> FrameUploadUrlBatchResponse:
+    items = [_issue_upload_url(db, current_user, item) for item in payload.items]
+    db.commit()
+    return FrameUploadUrlBatchResponse(items=items)
+
+
+def _complete_frame(db: Session, current_user: User, frame_id: uuid.UUID) -> FrameCompleteResponse:
+    """Verify ownership and sign read URLs; the caller commits."""
     frame = db.get(SavedFrame, frame_id)
     if frame is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Frame not found")
@@ -113,8 +149,6 @@ def complete_upload(
             "shape_mode": frame.shape_mode,
         },
     )
-    db.commit()
-
     return FrameCompleteResponse(
         id=frame.id,
         frame_url=frame_url,
@@ -123,6 +157,32 @@ def complete_upload(
     )
 
 
+@router.post("/{frame_id}/complete", response_model=FrameCompleteResponse)
+@limiter.limit("180/minute")
+def complete_upload(
+    request: Request,
+    frame_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> FrameCompleteResponse:
+    response = _complete_frame(db, current_user, frame_id)
+    db.commit()
+    return response
+
+
+@router.post("/complete/batch", response_model=FrameCompleteBatchResponse)
+@limiter.limit("45/minute")
+def complete_uploads_batch(
+    request: Request,
+    payload: FrameCompleteBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> FrameCompleteBatchResponse:
+    items = [_complete_frame(db, current_user, frame_id) for frame_id in payload.frame_ids]
+    db.commit()
+    return FrameCompleteBatchResponse(items=items)
+
+
 @router.get("", response_model=FramesPage)
 def list_frames(
     limit: int = Query(default=30, ge=1, le=200),
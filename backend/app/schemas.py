@@ -95,6 +95,14 @@ class FrameUploadUrlResponse(BaseModel):
     expires_in: int
 
 
+class FrameUploadUrlBatchRequest(BaseModel):
+    items: list[FrameUploadUrlRequest] = Field(min_length=1, max_length=16)
+
+
+class FrameUploadUrlBatchResponse(BaseModel):
+    items: list[FrameUploadUrlResponse]
+
+
 class FrameCompleteResponse(BaseModel):
     id: uuid.UUID
     frame_url: str
@@ -102,6 +110,14 @@ class FrameCompleteResponse(BaseModel):
     created_at: datetime
 
 
+class FrameCompleteBatchRequest(BaseModel):
+    frame_ids: list[uuid.UUID] = Field(min_length=1, max_length=16)
+
+
+class FrameCompleteBatchResponse(BaseModel):
+    items: list[FrameCompleteResponse]
+
+
 class FrameOut(BaseModel):
     id: uuid.UUID
     user_id: uuid.UUID
@@ -17,7 +17,9 @@ Orchestrates all subsystems:
 from __future__ import annotations
 
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import cv2
 import numpy as np
 
@@ -38,7 +40,7 @@ from performance.fps_optimizer         import FPSOptimizer
 from core.state_manager                import AppState, DrawingState
 from voice.voice_listener              import VoiceListener
 from voice.command_parser              import CommandParser, CommandType
-from services.frame_uploader           import FrameUploader
+from services.frame_uploader           import FrameUploader, start_log_listener
 
 from utils.config import (
     CAMERA_INDEX, DISPLAY_WIDTH, DISPLAY_HEIGHT, TARGET_FPS,
@@ -47,7 +49,7 @@ from utils.config import (
     COL_PURPLE, COL_ORANGE, COL_WHITE,
     UI_ACCENT, UI_MUTED,
     VOICE_ENABLED, VOICE_LANGUAGE, VOICE_ENERGY_THRESHOLD,
-    VOICE_PAUSE_THRESHOLD, VOICE_PHRASE_LIMIT,
+    VOICE_PAUSE_THRESHOLD, VOICE_PHRASE_LIMIT, VOICE_GATE_RATIO,
     VOICE_BRUSH_STEP, VOICE_TOAST_DURATION,
     DEPTH_MODE, DEPTH_THRESHOLD,
     INDEX_TIP, THUMB_TIP,
@@ -55,6 +57,17 @@ from utils.config import (
 )
 
 
+_GESTURE_MSGS = {
+    Gesture.DRAWING:   "âœ Draw",
+    Gesture.FIST:      "âœŠ Stop",
+    Gesture.TWO:       "âœŒ Black",
+    Gesture.THREE:     "ðŸ¤Ÿ Blue",
+    Gesture.FOUR:      "ðŸ–– Red",
+    Gesture.OPEN_PALM: "ðŸ– Green",
+    Gesture.PINCH:     "ðŸ¤ Resize brush",
+}
+
+
 class AppController:
     """Coordinates the real-time AirCanvas runtime components."""
 
@@ -98,7 +111,16 @@ class AppController:
         self._state     = AppState()
         self._uploader  = FrameUploader.from_env()
         self._remote_session_started = False
+        # The render thread snapshots the frame (the HUD and fade keep drawing
+        # into it); the ring push then runs on this pool, handing the snapshot
+        # over without a second copy. The semaphore caps in-flight submissions
+        # so a slow ring drops frames instead of piling up futures.
+        self._upload_pool: ThreadPoolExecutor | None = None
+        self._upload_slots = threading.BoundedSemaphore(2)
+        self._upload_log = None
         if self._uploader:
+            self._upload_log = start_log_listener()
+            self._upload_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="UploadEnqueue")
             self._uploader.auto_capture_enabled = self._state.auto_capture_enabled
             self._uploader.set_auto_capture_interval(self._state.auto_capture_interval_sec)
             self._uploader.start()
@@ -123,6 +145,7 @@ class AppController:
             energy_threshold=VOICE_ENERGY_THRESHOLD,
             pause_threshold=VOICE_PAUSE_THRESHOLD,
             phrase_limit=VOICE_PHRASE_LIMIT,
+            gate_ratio=VOICE_GATE_RATIO,
         )
         self._parser    = CommandParser()
         self._voice_active = False
@@ -139,6 +162,7 @@ class AppController:
         self._shape_pinch_active = False
         self._fps_sum         = 0.0
         self._fps_samples     = 0
+        self._status_cache: tuple | None = None   # (state key, text, text width)
 
     # â”€â”€ Main loop â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
@@ -328,17 +352,19 @@ class AppController:
             if self._state.shape_mode and self._shapes.state == ShapeEngine.ANCHORING:
                 self._anchor_pulse.draw(output, fingertip, self._shapes.hold_progress)
 
+            # One clock read for every overlay animation this frame
+            hud_now = time.time()
             cursor_tip = fingertip_smooth if fingertip_smooth is not None else fingertip
             self._cursor.draw(output, cursor_tip, self._state.active_color,
-                              is_drawing, self._state.eraser_mode)
-            self._toast.draw(output)
-            self._hint.draw(output)
-            self._two_hand.draw(output)
-            self._voice_hud.draw(output, self._voice_active, self._state.depth_blocked)
+                              is_drawing, self._state.eraser_mode, now=hud_now)
+            self._toast.draw(output, now=hud_now)
+            self._hint.draw(output, now=hud_now)
+            self._two_hand.draw(output, now=hud_now)
+            self._voice_hud.draw(output, self._voice_active, self._state.depth_blocked, now=hud_now)
             self._draw_status(output)
             self._maybe_auto_capture(output)
 
-            output = self._fade.apply(output)
+            output = self._fade.apply(output, now=hud_now)
 
             if self._handle_keys(key, output):
                 break
@@ -481,7 +507,10 @@ class AppController:
     def _process_voice(self, frame):
         if not self._voice_active:
             return
-        text = self._voice.get_text()
+        for text in self._voice.drain():
+            self._handle_voice_text(text, frame)
+
+    def _handle_voice_text(self, text, frame):
         if not text:
             return
         self._state.last_voice_cmd = text
@@ -693,17 +722,9 @@ class AppController:
     # â”€â”€ Gesture change â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
     def _on_gesture_change(self, gesture: Gesture):
-        msgs = {
-            Gesture.DRAWING:   "âœ Draw",
-            Gesture.FIST:      "âœŠ Stop",
-            Gesture.TWO:       "âœŒ Black",
-            Gesture.THREE:     "ðŸ¤Ÿ Blue",
-            Gesture.FOUR:      "ðŸ–– Red",
-            Gesture.OPEN_PALM: "ðŸ– Green",
-            Gesture.PINCH:     "ðŸ¤ Resize brush",
-        }
-        if gesture in msgs:
-            self._hint.show(msgs[gesture])
+        msg = _GESTURE_MSGS.get(gesture)
+        if msg:
+            self._hint.show(msg)
         if gesture == Gesture.FIST:
             self._request_pause(
                 "fist gesture",
@@ -786,26 +807,39 @@ class AppController:
     def _queue_remote_frame(self, frame: np.ndarray, source: str) -> None:
         if not self._uploader or not self._remote_session_started:
             return
-        brush_mode = "eraser" if self._state.eraser_mode else f"brush_{self._state.thickness}px"
-        shape_mode = self._state.active_shape if self._state.shape_mode else "free_draw"
-        accepted = self._uploader.enqueue_frame(frame, brush_mode=f"{brush_mode}:{source}", shape_mode=shape_mode)
-        if not accepted:
-            print("[UPLOAD] Queue full. Dropping frame upload.")
+        self._submit_upload(frame, source, "[UPLOAD] Queue full. Dropping frame upload.")
 
     def _maybe_auto_capture(self, frame: np.ndarray) -> None:
         if not self._uploader or not self._remote_session_started:
             return
         if not self._state.auto_capture_enabled:
             return
-        self._uploader.set_auto_capture_interval(self._state.auto_capture_interval_sec)
+        # The uploader owns the timer; the [ / ] handlers push interval
+        # changes to it, and they apply from the last capture immediately.
         if not self._uploader.should_auto_capture_now():
             return
+        self._submit_upload(frame, "auto", "[UPLOAD] Auto-capture skipped (queue busy).")
 
+    def _submit_upload(self, frame: np.ndarray, source: str, drop_msg: str) -> None:
+        if not self._upload_slots.acquire(blocking=False):
+            print(drop_msg)
+            return
         brush_mode = "eraser" if self._state.eraser_mode else f"brush_{self._state.thickness}px"
         shape_mode = self._state.active_shape if self._state.shape_mode else "free_draw"
-        accepted = self._uploader.enqueue_frame(frame, brush_mode=f"{brush_mode}:auto", shape_mode=shape_mode)
-        if not accepted:
-            print("[UPLOAD] Auto-capture skipped (queue busy).")
+        future = self._upload_pool.submit(
+            self._uploader.enqueue_frame,
+            frame.copy(),
+            brush_mode=f"{brush_mode}:{source}",
+            shape_mode=shape_mode,
+            copy=False,
+        )
+
+        def _done(f: Future) -> None:
+            self._upload_slots.release()
+            if f.cancelled() or f.exception() is not None or not f.result():
+                print(drop_msg)
+
+        future.add_done_callback(_done)
 
     # â”€â”€ Helpers â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
@@ -859,6 +893,20 @@ class AppController:
 
     def _draw_status(self, frame: np.ndarray):
         h, w = frame.shape[:2]
+        st = self._state
+        key = (
+            st.slide_mode, self._slides.current_index, self._slides.count,
+            st.drawing_state, st.eraser_mode, st.shape_mode,
+            self._shapes.active_shape, st.bg_mode,
+        )
+        cache = self._status_cache
+        if cache is None or cache[0] != key:
+            cache = (key, *self._status_text())
+            self._status_cache = cache
+        _, text, tw = cache
+        cv2.putText(frame,text,(w-tw-10,h-10),cv2.FONT_HERSHEY_SIMPLEX,0.40,UI_MUTED,1,cv2.LINE_AA)
+
+    def _status_text(self) -> tuple[str, int]:
         if self._state.slide_mode:
             mode = f"SLIDES  {self._slides.current_index+1}/{max(self._slides.count,1)}"
         elif self._state.drawing_state == DrawingState.PAUSED:
@@ -874,15 +922,19 @@ class AppController:
         text   = f"{mode} [{state_tag}]{bg_tag}"
         font,scale = cv2.FONT_HERSHEY_SIMPLEX, 0.40
         (tw,_),_   = cv2.getTextSize(text,font,scale,1)
-        cv2.putText(frame,text,(w-tw-10,h-10),font,scale,UI_MUTED,1,cv2.LINE_AA)
+        return text, tw
 
     # â”€â”€ Shutdown â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
     def _shutdown(self):
         print("[INFO] Shutting down ...")
         avg_fps = (self._fps_sum / self._fps_samples) if self._fps_samples else None
+        if self._upload_pool:
+            self._upload_pool.shutdown(wait=False)
         if self._uploader:
             self._uploader.stop(avg_fps=avg_fps)
+        if self._upload_log:
+            self._upload_log.stop()   # flushes queued records
         self._det_thread.stop()
         self._voice.stop()
         self._detector.release()
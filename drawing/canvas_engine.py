@@ -8,6 +8,7 @@ canvas_engine.py
   • Alpha-blended shape preview
   • blit_image for media import
   • save (PNG + transparent)
+  • Stroke log (structure-of-arrays, vector .npz export)
 """
 
 from __future__ import annotations
@@ -27,25 +28,142 @@ from utils.config import (
 )
 
 
+class StrokeLog:
+    """
+    Structure-of-arrays record of drawing ops, kept alongside the raster.
+
+    One row per draw_line / draw_dot / draw_shape / clear / blit_image, with
+    columns x1, y1, x2, y2 (int16), color (uint8 N×3), thick and kind (uint8).
+    Storage doubles when full, so appends are amortised O(1).
+    """
+
+    KIND_LINE  = 0
+    KIND_ERASE = 1
+    KIND_DOT   = 2
+    KIND_CLEAR = 3
+    KIND_IMAGE = 4
+    SHAPE_KINDS = {
+        "rectangle": 10, "circle": 11, "ellipse": 12,
+        "line": 13, "triangle": 14, "heart": 15,
+    }
+
+    _COLUMNS = (
+        ("x1", np.int16, ()), ("y1", np.int16, ()),
+        ("x2", np.int16, ()), ("y2", np.int16, ()),
+        ("color", np.uint8, (3,)), ("thick", np.uint8, ()), ("kind", np.uint8, ()),
+    )
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._n = 0
+        self._cap = max(16, int(capacity))
+        self._cols = {
+            name: np.zeros((self._cap, *shape), dtype) for name, dtype, shape in self._COLUMNS
+        }
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(self, kind: int, p1, p2, color=(0, 0, 0), thick: int = 0) -> None:
+        n = self._n
+        if n == self._cap:
+            self._grow(n + 1)
+        cols = self._cols
+        cols["x1"][n] = p1[0]
+        cols["y1"][n] = p1[1]
+        cols["x2"][n] = p2[0]
+        cols["y2"][n] = p2[1]
+        cols["color"][n] = color[:3]
+        cols["thick"][n] = min(255, int(thick))
+        cols["kind"][n] = kind
+        self._n = n + 1
+
+    def split(self, n: int) -> dict[str, np.ndarray]:
+        """Truncate to n rows and return the removed tail (for redo)."""
+        n = min(n, self._n)
+        tail = {name: col[n:self._n].copy() for name, col in self._cols.items()}
+        self._n = n
+        return tail
+
+    def extend(self, rows: dict[str, np.ndarray]) -> None:
+        k = len(rows["kind"])
+        if not k:
+            return
+        if self._n + k > self._cap:
+            self._grow(self._n + k)
+        for name, col in self._cols.items():
+            col[self._n:self._n + k] = rows[name]
+        self._n += k
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        """Views of the filled rows, one array per column."""
+        return {name: col[:self._n] for name, col in self._cols.items()}
+
+    def _grow(self, need: int) -> None:
+        cap = self._cap
+        while cap < need:
+            cap *= 2
+        for name, col in self._cols.items():
+            grown = np.zeros((cap, *col.shape[1:]), col.dtype)
+            grown[:self._n] = col[:self._n]
+            self._cols[name] = grown
+        self._cap = cap
+
+
 class CanvasEngine:
 
     def __init__(self, w=DISPLAY_WIDTH, h=DISPLAY_HEIGHT, alpha=CANVAS_ALPHA):
         self._w, self._h = w, h
         self._alpha      = alpha
         self._alpha_scale = float(alpha) / 255.0
+        # Canvas alpha -> Q8 blend weight (0..256), so blend() stays in uint16.
+        self._alpha_q8 = np.round(
+            np.arange(256, dtype=np.float32) * (self._alpha_scale * 256.0)
+        ).astype(np.uint16)
         self._canvas     = self._blank()
         self._bbox: Optional[tuple[int, int, int, int]] = None
         self._bbox_stale = False
         self._undo: list[np.ndarray] = []
         self._redo: list[np.ndarray] = []
+        # Parallel stacks of the bbox that was valid for each saved canvas.
+        self._undo_bbox: list[Optional[tuple[int, int, int, int]]] = []
+        self._redo_bbox: list[Optional[tuple[int, int, int, int]]] = []
+        self._log = StrokeLog()
+        self._undo_log: list[int] = []                    # log length per undo entry
+        self._redo_log: list[dict[str, np.ndarray]] = []  # log rows per redo entry
         self._bg_mode    = "none"   # "none" | "grid" | "ruled"
+        # Bumped on every pixel mutation; keys the resized-canvas cache.
+        self._version    = 0
+        self._resized_key: Optional[tuple[int, int, int]] = None
+        self._resized: Optional[tuple[np.ndarray, Optional[tuple[int, int, int, int]]]] = None
+        # Consecutive same-colour/same-width stroke points, rasterised together
+        # by flush_pending() as a single cv2.polylines call.
+        self._pending_pts: list[tuple[int, int]] = []
+        self._pending_color: tuple = (0, 0, 0, 0)
+        self._pending_thick: int = 1
 
     # ── Drawing ───────────────────────────────────────────────────────────────
 
     def draw_line(self, p1, p2, color, thickness, eraser=False):
         start = p1 if p1 else p2
         c = (0, 0, 0, 0) if eraser else (*color[:3], 255)
-        cv2.line(self._canvas, start, p2, c, thickness, cv2.LINE_AA)
+        pts = self._pending_pts
+        if (
+            not p1
+            or not pts
+            or pts[-1] != tuple(start)
+            or c != self._pending_color
+            or thickness != self._pending_thick
+        ):
+            self.flush_pending()
+            pts.clear()
+            pts.append(tuple(start))
+            self._pending_color = c
+            self._pending_thick = thickness
+        pts.append(tuple(p2))
+        self._log.append(
+            StrokeLog.KIND_ERASE if eraser else StrokeLog.KIND_LINE,
+            start, p2, color, thickness,
+        )
         pad = max(2, int(thickness) + 2)
         self._mark_bbox(
             min(start[0], p2[0]) - pad,
@@ -55,13 +173,31 @@ class CanvasEngine:
             stale=eraser,
         )
 
+    def flush_pending(self) -> None:
+        """Rasterise queued stroke segments onto the canvas."""
+        pts = self._pending_pts
+        if len(pts) < 2:
+            return
+        cv2.polylines(
+            self._canvas, [np.array(pts, np.int32)], False,
+            self._pending_color, self._pending_thick, cv2.LINE_AA,
+        )
+        self._version += 1
+        # Keep the last point so the next segment continues the same run.
+        del pts[:-1]
+
     def draw_dot(self, pt, color, thickness):
+        self.flush_pending()
+        self._version += 1
         c = (*color[:3], 255)
         cv2.circle(self._canvas, pt, max(1, thickness//2), c, cv2.FILLED, cv2.LINE_AA)
+        self._log.append(StrokeLog.KIND_DOT, pt, pt, color, thickness)
         r = max(1, thickness // 2) + 2
         self._mark_bbox(pt[0] - r, pt[1] - r, pt[0] + r, pt[1] + r)
 
     def draw_shape(self, shape, p1, p2, color, thickness, filled=False):
+        self.flush_pending()
+        self._version += 1
         c    = (*color[:3], 255)
         fill = cv2.FILLED if filled else thickness
         x1, y1 = min(p1[0], p2[0]), min(p1[1], p2[1])
@@ -84,6 +220,9 @@ class CanvasEngine:
             else: cv2.polylines(self._canvas,[pts],True,c,thickness,cv2.LINE_AA)
         elif shape == "heart":
             self._draw_heart(cx, cy, max(x2-x1, y2-y1)//2, c, thickness, filled)
+        kind = StrokeLog.SHAPE_KINDS.get(shape)
+        if kind is not None:
+            self._log.append(kind, p1, p2, color, 0 if filled else thickness)
         pad = max(2, int(thickness) + 2)
         if shape == "line":
             self._mark_bbox(
@@ -115,28 +254,51 @@ class CanvasEngine:
     # ── Undo / Redo ───────────────────────────────────────────────────────────
 
     def push_undo(self):
+        self.flush_pending()
         if len(self._undo) >= MAX_UNDO_STEPS:
             self._undo.pop(0)
+            self._undo_bbox.pop(0)
+            self._undo_log.pop(0)
         self._undo.append(self._canvas.copy())
+        self._undo_bbox.append(self._bbox)
+        self._undo_log.append(len(self._log))
         self._redo.clear()
+        self._redo_bbox.clear()
+        self._redo_log.clear()
 
     def undo(self) -> bool:
         if not self._undo: return False
+        self.flush_pending()
         self._redo.append(self._canvas.copy())
+        self._redo_bbox.append(self._bbox)
+        self._redo_log.append(self._log.split(self._undo_log.pop()))
         self._canvas = self._undo.pop()
-        self._bbox_stale = True
+        self._restore_bbox(self._undo_bbox.pop())
         return True
 
     def redo(self) -> bool:
         if not self._redo: return False
+        self.flush_pending()
         self._undo.append(self._canvas.copy())
+        self._undo_bbox.append(self._bbox)
+        self._undo_log.append(len(self._log))
+        self._log.extend(self._redo_log.pop())
         self._canvas = self._redo.pop()
-        self._bbox_stale = True
+        self._restore_bbox(self._redo_bbox.pop())
         return True
 
+    def _restore_bbox(self, bbox: Optional[tuple[int, int, int, int]]) -> None:
+        self._version += 1
+        # A saved bbox may be a superset after erasing, which blend() tolerates,
+        # so it can be reused without rescanning the alpha plane.
+        self._bbox = bbox
+        self._bbox_stale = False
+
     def clear(self):
         self.push_undo()
         self._canvas = self._blank()
+        self._version += 1
+        self._log.append(StrokeLog.KIND_CLEAR, (0, 0), (0, 0))
         self._bbox = None
         self._bbox_stale = False
 
@@ -149,35 +311,28 @@ class CanvasEngine:
     def _draw_bg(self, frame: np.ndarray) -> np.ndarray:
         if self._bg_mode == "none":
             return frame
-        h, w = frame.shape[:2]
         out  = frame.copy()
         col  = (30, 30, 42)
+        # 1px axis-aligned lines are plain strided writes; one slice assignment
+        # per direction replaces a cv2.line call per grid line.
         if self._bg_mode == "grid":
-            for x in range(0, w, GRID_CELL_SIZE):
-                cv2.line(out, (x,0),(x,h), col, 1)
-            for y in range(0, h, GRID_CELL_SIZE):
-                cv2.line(out, (0,y),(w,y), col, 1)
+            out[:, ::GRID_CELL_SIZE] = col
+            out[::GRID_CELL_SIZE, :] = col
         elif self._bg_mode == "ruled":
-            for y in range(GRID_CELL_SIZE, h, GRID_CELL_SIZE):
-                cv2.line(out, (0,y),(w,y), col, 1)
+            out[GRID_CELL_SIZE::GRID_CELL_SIZE, :] = col
         return out
 
     # ── Blend ─────────────────────────────────────────────────────────────────
 
     def blend(self, camera_frame: np.ndarray) -> np.ndarray:
+        self.flush_pending()
         base = self._draw_bg(camera_frame)
         h, w = base.shape[:2]
         c    = self._canvas
         if c.shape[:2] != (h,w):
-            c = cv2.resize(c,(w,h))
-            alpha_plane = c[:, :, 3]
-            if not np.any(alpha_plane):
-                return base
-            nz = cv2.findNonZero(alpha_plane)
-            if nz is None:
+            c, bbox = self._resized_canvas(w, h)
+            if bbox is None:
                 return base
-            x, y, bw, bh = cv2.boundingRect(nz)
-            bbox = (x, y, x + bw, y + bh)
         else:
             if self._bbox_stale:
                 self._recompute_bbox()
@@ -201,13 +356,32 @@ class CanvasEngine:
                 return base
 
         out = base.copy()
-        w2 = alpha_plane.astype(np.float32) * self._alpha_scale
-        w1 = 1.0 - w2
         roi_base = out[y1:y2, x1:x2]
         roi_canvas = c[y1:y2, x1:x2, :3]
-        out[y1:y2, x1:x2] = cv2.blendLinear(roi_base, roi_canvas, w1, w2)
+        # (base*(256-wq8) + canvas*wq8 + 128) >> 8 peaks at 65408, so uint16 holds it.
+        wq8 = self._alpha_q8[alpha_plane][:, :, None]
+        acc = roi_canvas * wq8
+        acc += roi_base * (256 - wq8)
+        acc += 128
+        acc >>= 8
+        roi_base[:] = acc
         return out
 
+    def _resized_canvas(self, w: int, h: int):
+        """Canvas scaled to the frame size plus its bbox, rebuilt only on change."""
+        key = (self._version, w, h)
+        if self._resized_key != key:
+            c = cv2.resize(self._canvas, (w, h))
+            nz = cv2.findNonZero(c[:, :, 3])
+            if nz is None:
+                bbox = None
+            else:
+                x, y, bw, bh = cv2.boundingRect(nz)
+                bbox = (x, y, x + bw, y + bh)
+            self._resized = (c, bbox)
+            self._resized_key = key
+        return self._resized
+
     def blend_with_preview(self, camera_frame, shape, p1, p2, color, thickness) -> np.ndarray:
         out = self.blend(camera_frame)
         x1,y1 = min(p1[0],p2[0]), min(p1[1],p2[1])
@@ -258,14 +432,26 @@ class CanvasEngine:
         cv2.imwrite(path, blended)
         return path
 
-    def save_transparent(self, username="user") -> str:
+    def save_transparent(self, username="user", vector=False) -> str:
+        """Save the drawing layer as a BGRA PNG, or its stroke log as .npz."""
         os.makedirs(SAVE_DIR, exist_ok=True)
         ts   = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        if vector:
+            path = os.path.join(SAVE_DIR, f"{SAVE_PREFIX}_{username}_{ts}_strokes.npz")
+            np.savez_compressed(path, size=np.array([self._w, self._h]), **self._log.arrays())
+            return path
         path = os.path.join(SAVE_DIR, f"{SAVE_PREFIX}_{username}_{ts}_transparent.png")
+        self.flush_pending()
         cv2.imwrite(path, self._canvas)
         return path
 
+    @property
+    def stroke_log(self) -> StrokeLog:
+        return self._log
+
     def blit_image(self, img_bgra: np.ndarray, x: int, y: int):
+        self.flush_pending()
+        self._version += 1
         ih,iw = img_bgra.shape[:2]
         x2,y2 = min(x+iw,self._w), min(y+ih,self._h)
         iw,ih = x2-x, y2-y
@@ -281,23 +467,31 @@ class CanvasEngine:
         else:
             self._canvas[y:y2,x:x2,:3] = patch[:ih,:iw,:3]
             self._canvas[y:y2,x:x2,3]  = 255
+        self._log.append(StrokeLog.KIND_IMAGE, (x, y), (x2, y2))
         self._mark_bbox(x, y, x2, y2)
 
     def _mark_bbox(self, x1: int, y1: int, x2: int, y2: int, stale: bool = False) -> None:
         if stale:
             self._bbox_stale = True
             return
-        x1 = max(0, min(self._w, int(x1)))
-        y1 = max(0, min(self._h, int(y1)))
-        x2 = max(0, min(self._w, int(x2)))
-        y2 = max(0, min(self._h, int(y2)))
+        # Called for every stroke sample: plain comparisons avoid the builtin
+        # min/max call overhead. Callers always pass x1 <= x2 and y1 <= y2, so
+        # only the outer edges need clamping; off-canvas boxes end up empty.
+        x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+        if x1 < 0: x1 = 0
+        if y1 < 0: y1 = 0
+        if x2 > self._w: x2 = self._w
+        if y2 > self._h: y2 = self._h
         if x2 <= x1 or y2 <= y1:
             return
-        if self._bbox is None:
-            self._bbox = (x1, y1, x2, y2)
-        else:
-            bx1, by1, bx2, by2 = self._bbox
-            self._bbox = (min(bx1, x1), min(by1, y1), max(bx2, x2), max(by2, y2))
+        bbox = self._bbox
+        if bbox is not None:
+            bx1, by1, bx2, by2 = bbox
+            if bx1 < x1: x1 = bx1
+            if by1 < y1: y1 = by1
+            if bx2 > x2: x2 = bx2
+            if by2 > y2: y2 = by2
+        self._bbox = (x1, y1, x2, y2)
         self._bbox_stale = False
 
     def _recompute_bbox(self) -> None:
@@ -42,7 +42,9 @@ class ShapeEngine:
         self._anchor_cand:   Optional[tuple] = None
         self._still_r = SHAPE_STILL_RADIUS_PX
         self._min_move_px = SHAPE_MIN_MOVE_PX
+        self._min_move_sq = SHAPE_MIN_MOVE_PX * SHAPE_MIN_MOVE_PX
         self._min_size_px = SHAPE_MIN_SIZE_PX
+        self._min_size_sq = SHAPE_MIN_SIZE_PX * SHAPE_MIN_SIZE_PX
         self._ema_tip: Optional[tuple[float, float]] = None
 
     def update(
@@ -54,11 +56,12 @@ class ShapeEngine:
         Update shape anchor/preview. Finalization is explicit via finalize().
         """
         stable_tip = self._smooth_tip(fingertip)
+        now = time.time()
 
         if self.state == self.IDLE:
             if not drawing_active or stable_tip is None:
                 return
-            self._hold_start  = time.time()
+            self._hold_start  = now
             self._anchor_cand = stable_tip
             self.state        = self.ANCHORING
             return
@@ -70,10 +73,10 @@ class ShapeEngine:
             dx = abs(stable_tip[0] - self._anchor_cand[0])
             dy = abs(stable_tip[1] - self._anchor_cand[1])
             if dx > self._still_r or dy > self._still_r:
-                self._hold_start  = time.time()
+                self._hold_start  = now
                 self._anchor_cand = stable_tip
                 return
-            if time.time() - self._hold_start >= SHAPE_HOLD_SECONDS:
+            if now - self._hold_start >= SHAPE_HOLD_SECONDS:
                 self.anchor  = self._anchor_cand
                 self.current = self._anchor_cand
                 self.state   = self.DRAGGING
@@ -83,9 +86,12 @@ class ShapeEngine:
             if drawing_active and stable_tip is not None:
                 if self.current is None:
                     self.current = stable_tip
-                elif self._dist(self.current, stable_tip) >= self._min_move_px:
+                else:
                     # Ignore micro-jitter to keep preview geometry stable.
-                    self.current = stable_tip
+                    dx = stable_tip[0] - self.current[0]
+                    dy = stable_tip[1] - self.current[1]
+                    if dx * dx + dy * dy >= self._min_move_sq:
+                        self.current = stable_tip
 
     def finalize(self) -> Optional[tuple]:
         """Commit current preview geometry if valid."""
@@ -149,15 +155,9 @@ class ShapeEngine:
         sx, sy = self._ema_tip
         return int(round(sx)), int(round(sy))
 
-    @staticmethod
-    def _dist(p1: tuple, p2: tuple) -> float:
-        dx = p1[0] - p2[0]
-        dy = p1[1] - p2[1]
-        return (dx * dx + dy * dy) ** 0.5
-
     def _is_valid_shape(self, p1: tuple, p2: tuple) -> bool:
         dx = abs(p1[0] - p2[0])
         dy = abs(p1[1] - p2[1])
         if self.active_shape == "line":
-            return (dx * dx + dy * dy) ** 0.5 >= self._min_size_px
+            return dx * dx + dy * dy >= self._min_size_sq
         return max(dx, dy) >= self._min_size_px
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from typing import Optional
 
@@ -22,15 +23,19 @@ import numpy as np
 
 from hand_tracking.multi_hand_detector import HandResult
 from utils.config import (
-    DEBOUNCE_DELAY, CLEAR_HOLD_DURATION, GESTURE_COLOR_MAP,
+    DEBOUNCE_DELAY, DEBOUNCE_SAMPLES, CLEAR_HOLD_DURATION, GESTURE_COLOR_MAP,
     PINCH_THRESHOLD, SWIPE_VELOCITY_THRESH, SWIPE_WINDOW, EMA_ALPHA,
     COL_GREEN, WRIST, THUMB_TIP, THUMB_IP,
     INDEX_TIP, INDEX_PIP, MIDDLE_TIP, MIDDLE_PIP,
     RING_TIP, RING_PIP, PINKY_TIP, PINKY_PIP,
     KALMAN_PROCESS_NOISE, KALMAN_MEASURE_NOISE,
-    DISPLAY_WIDTH,
+    DISPLAY_WIDTH, PARALLEL_HAND_CLASSIFY,
 )
 
+# Index/middle/ring/pinky landmark indices, compared as one vector op in _count.
+_TIP_IDX = np.array([INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
+_PIP_IDX = np.array([INDEX_PIP, MIDDLE_PIP, RING_PIP, PINKY_PIP])
+
 
 class Gesture(Enum):
     NONE      = auto()
@@ -43,6 +48,16 @@ class Gesture(Enum):
     PINCH     = auto()
 
 
+# Finger count -> gesture, and Gesture.value - 1 -> colour finger count
+# (-1 if none): tuple indexing instead of building a dict per call.
+_COUNT_TO_G = (Gesture.FIST, Gesture.DRAWING, Gesture.TWO,
+               Gesture.THREE, Gesture.FOUR, Gesture.OPEN_PALM)
+_FC_FROM_G = tuple(
+    {Gesture.OPEN_PALM: 5, Gesture.FOUR: 4, Gesture.THREE: 3, Gesture.TWO: 2}.get(g, -1)
+    for g in sorted(Gesture, key=lambda g: g.value)
+)
+
+
 class KalmanPoint:
     """1D Kalman filter for smoothing a single coordinate."""
 
@@ -68,31 +83,62 @@ class KalmanPoint:
         self._init = False
 
 
+class KalmanPoint2D:
+    """
+    Kalman filter for an (x, y) point, updated as one ndarray op.
+
+    Both axes share q, r and their update count, so their covariance and
+    gain are identical; only the state is a vector.
+    """
+
+    def __init__(self, q: float = KALMAN_PROCESS_NOISE, r: float = KALMAN_MEASURE_NOISE):
+        self._x   = np.zeros(2, dtype=np.float32)
+        self._tmp = np.zeros(2, dtype=np.float32)
+        self._p   = 1.0
+        self._q   = q
+        self._r   = r
+        self._init = False
+
+    def update(self, z: np.ndarray) -> np.ndarray:
+        if not self._init:
+            self._x[:] = z
+            self._init = True
+            return self._x
+        self._p += self._q
+        k        = self._p / (self._p + self._r)
+        np.subtract(z, self._x, out=self._tmp)
+        self._tmp *= k
+        self._x  += self._tmp
+        self._p   = (1 - k) * self._p
+        return self._x
+
+    def reset(self) -> None:
+        self._init = False
+
+
 class HandGestureState:
     """Gesture tracking state for a single hand."""
 
     def __init__(self) -> None:
-        self.kx = KalmanPoint()
-        self.ky = KalmanPoint()
+        self.kf = KalmanPoint2D()
         self.raw_gesture     = Gesture.NONE
         self.stable_gesture  = Gesture.NONE
         self._last_change    = 0.0
+        self._raw_ring: deque = deque(maxlen=DEBOUNCE_SAMPLES)
         self._palm_start: Optional[float] = None
         self._clear_fired    = False
-        self._swipe_history: deque = deque(maxlen=30)
+        # (t, x) samples; _swipe trims entries older than SWIPE_WINDOW in place.
+        self._swipe_history: deque = deque()
         self._last_swipe     = 0.0
         self.color           = COL_GREEN
         self._prev_pinch     = None
 
-    def smooth_tip(self, pixel_lm: list) -> tuple[int, int]:
-        raw = pixel_lm[INDEX_TIP]
-        sx  = int(self.kx.update(raw[0]))
-        sy  = int(self.ky.update(raw[1]))
-        return sx, sy
+    def smooth_tip(self, pixel_lm: np.ndarray) -> tuple[int, int]:
+        xy = self.kf.update(pixel_lm[INDEX_TIP])
+        return int(xy[0]), int(xy[1])
 
     def reset_smooth(self) -> None:
-        self.kx.reset()
-        self.ky.reset()
+        self.kf.reset()
 
 
 class GestureResult:
@@ -131,18 +177,37 @@ class GestureEngine:
 
     def __init__(self) -> None:
         self._states = [HandGestureState(), HandGestureState()]
+        self._pool: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=2, thread_name_prefix="Classify")
+            if PARALLEL_HAND_CLASSIFY else None
+        )
 
     def update(self, hands: list) -> GestureResult:
         r = GestureResult()
+        now = time.time()   # one clock read per frame, shared by all timers
 
         # ── Two-hand combos ───────────────────────────────────────────────
+        raw_g: Optional[Gesture] = None
         if len(hands) == 2:
-            g0 = self._classify(hands[0].norm_lm, hands[0].pixel_lm)
-            g1 = self._classify(hands[1].norm_lm, hands[1].pixel_lm)
+            g0, g1 = self._classify_pair(hands[0], hands[1])
+            raw_g  = g0
             if g0 == Gesture.OPEN_PALM and g1 == Gesture.OPEN_PALM:
                 r.two_hand_clear = True
             if g0 == Gesture.FIST and g1 == Gesture.FIST:
                 r.two_hand_pause = True
+            if r.two_hand_clear or r.two_hand_pause:
+                # Combo owns this frame: no debounce, pinch, palm or swipe.
+                # Gesture, colour and cursor carry over unchanged so the combo
+                # neither resets the brush nor re-fires a gesture change.
+                st = self._states[0]
+                st._prev_pinch = None
+                st._swipe_history.clear()
+                self._reset_palm(st)
+                r.gesture       = st.stable_gesture
+                r.color         = st.color
+                r.fingertip     = st.smooth_tip(hands[0].pixel_lm_arr)
+                r.fingertip_raw = hands[0].index_tip
+                return r
 
         # ── Primary hand (drawing) ────────────────────────────────────────
         if not hands:
@@ -152,10 +217,11 @@ class GestureEngine:
 
         h0    = hands[0]
         st    = self._states[0]
-        raw_g = self._classify(h0.norm_lm, h0.pixel_lm)
-        self._debounce(st, raw_g)
+        if raw_g is None:
+            raw_g = self._classify(h0)
+        self._debounce(st, raw_g, now)
         r.gesture  = st.stable_gesture
-        smoothed_tip = st.smooth_tip(h0.pixel_lm)
+        smoothed_tip = st.smooth_tip(h0.pixel_lm_arr)
         r.fingertip = smoothed_tip
         r.fingertip_raw = h0.index_tip
 
@@ -167,18 +233,17 @@ class GestureEngine:
 
         # Clear hold
         if st.stable_gesture == Gesture.OPEN_PALM:
-            r.clear = self._palm_timer(st)
+            r.clear = self._palm_timer(st, now)
         else:
             self._reset_palm(st)
 
         # Pinch delta (only while in explicit pinch gesture)
         if st.stable_gesture == Gesture.PINCH:
-            r.pinch_delta = self._pinch(h0.norm_lm, st)
+            r.pinch_delta = self._pinch(h0.norm_lm_arr, st)
         else:
             st._prev_pinch = None
 
         # Swipe
-        now = time.time()
         st._swipe_history.append((now, smoothed_tip[0]))
         r.undo, r.redo, r.slide_next, r.slide_prev = self._swipe(st, now)
 
@@ -186,48 +251,73 @@ class GestureEngine:
 
     # ── Finger counting ───────────────────────────────────────────────────────
 
-    def _classify(self, norm_lm: list, pixel_lm: list) -> Gesture:
-        if self._is_pinch(norm_lm):
+    def _classify(self, hand: HandResult) -> Gesture:
+        if self._is_pinch(hand.norm_lm_arr):
             return Gesture.PINCH
-        n = self._count(norm_lm, pixel_lm)
-        return {0: Gesture.FIST, 1: Gesture.DRAWING, 2: Gesture.TWO,
-                3: Gesture.THREE, 4: Gesture.FOUR, 5: Gesture.OPEN_PALM
-                }.get(n, Gesture.NONE)
+        return self._from_count(self._count(hand.norm_lm_arr, hand.pixel_lm_arr))
+
+    @staticmethod
+    def _from_count(n: int) -> Gesture:
+        return _COUNT_TO_G[n] if 0 <= n <= 5 else Gesture.NONE
+
+    def _classify_pair(self, h0: HandResult, h1: HandResult) -> tuple[Gesture, Gesture]:
+        if self._pool is not None:
+            f1 = self._pool.submit(self._classify, h1)
+            return self._classify(h0), f1.result()
+        # Both hands as (2, 21, k) stacks: pinch and finger counts in one pass.
+        norm  = np.stack((h0.norm_lm_arr, h1.norm_lm_arr))
+        pixel = np.stack((h0.pixel_lm_arr, h1.pixel_lm_arr))
+        d = norm[:, THUMB_TIP, :2] - norm[:, INDEX_TIP, :2]
+        pinch = np.hypot(d[:, 0], d[:, 1]) < PINCH_THRESHOLD
+        wx, tip_x, ip_x = norm[:, WRIST, 0], norm[:, THUMB_TIP, 0], norm[:, THUMB_IP, 0]
+        counts = (((tip_x - ip_x) * (ip_x - wx) > 0.0)
+                  + (pixel[:, _TIP_IDX, 1] < pixel[:, _PIP_IDX, 1]).sum(axis=1)).tolist()
+        g0, g1 = (Gesture.PINCH if p else self._from_count(n)
+                  for p, n in zip(pinch.tolist(), counts))
+        return g0, g1
 
     @staticmethod
-    def _is_pinch(norm_lm: list) -> bool:
-        dx = norm_lm[THUMB_TIP][0] - norm_lm[INDEX_TIP][0]
-        dy = norm_lm[THUMB_TIP][1] - norm_lm[INDEX_TIP][1]
-        return (dx**2 + dy**2) ** 0.5 < PINCH_THRESHOLD
-
-    def _count(self, norm_lm, pixel_lm) -> int:
-        c = 0
-        wx = norm_lm[WRIST][0]
-        tip_x, ip_x = norm_lm[THUMB_TIP][0], norm_lm[THUMB_IP][0]
-        c += int(tip_x > ip_x) if wx < ip_x else int(tip_x < ip_x)
-        for tip, pip in [(INDEX_TIP, INDEX_PIP), (MIDDLE_TIP, MIDDLE_PIP),
-                         (RING_TIP, RING_PIP),   (PINKY_TIP, PINKY_PIP)]:
-            c += int(pixel_lm[tip][1] < pixel_lm[pip][1])
-        return c
+    def _pinch_dist(norm_lm: np.ndarray) -> float:
+        d = norm_lm[THUMB_TIP, :2] - norm_lm[INDEX_TIP, :2]
+        return float(np.hypot(d[0], d[1]))
+
+    @classmethod
+    def _is_pinch(cls, norm_lm: np.ndarray) -> bool:
+        return cls._pinch_dist(norm_lm) < PINCH_THRESHOLD
+
+    def _count(self, norm_lm: np.ndarray, pixel_lm: np.ndarray) -> int:
+        wx = norm_lm[WRIST, 0]
+        tip_x, ip_x = norm_lm[THUMB_TIP, 0], norm_lm[THUMB_IP, 0]
+        # Thumb is extended when its tip lies past the IP joint, away from
+        # the wrist — a sign test instead of a handedness branch.
+        c = int((tip_x - ip_x) * (ip_x - wx) > 0.0)
+        return c + int((pixel_lm[_TIP_IDX, 1] < pixel_lm[_PIP_IDX, 1]).sum())
 
     # ── Debounce ──────────────────────────────────────────────────────────────
 
-    def _debounce(self, st: HandGestureState, raw: Gesture) -> None:
-        now = time.time()
+    def _debounce(self, st: HandGestureState, raw: Gesture, now: float) -> None:
+        """
+        Deferred debounce: commit a new stable gesture only once it has held
+        for `delay` AND the last DEBOUNCE_SAMPLES raw samples all agree, so a
+        single slow frame cannot flip state on one sample.
+        """
+        ring = st._raw_ring
+        ring.append(raw)
         if raw != st.raw_gesture:
             st.raw_gesture  = raw
             st._last_change = now
+        if st.stable_gesture == raw:
+            return
         delay = DEBOUNCE_DELAY
         if raw in (Gesture.DRAWING, Gesture.FIST):
             delay *= 0.6
         if (now - st._last_change >= delay
-                and st.stable_gesture != st.raw_gesture):
-            st.stable_gesture = st.raw_gesture
+                and len(ring) == ring.maxlen and ring.count(raw) == len(ring)):
+            st.stable_gesture = raw
 
     # ── Palm clear hold ───────────────────────────────────────────────────────
 
-    def _palm_timer(self, st: HandGestureState) -> bool:
-        now = time.time()
+    def _palm_timer(self, st: HandGestureState, now: float) -> bool:
         if st._palm_start is None:
             st._palm_start  = now
             st._clear_fired = False
@@ -242,10 +332,8 @@ class GestureEngine:
 
     # ── Pinch ─────────────────────────────────────────────────────────────────
 
-    def _pinch(self, norm_lm: list, st: HandGestureState) -> int:
-        dx   = norm_lm[THUMB_TIP][0] - norm_lm[INDEX_TIP][0]
-        dy   = norm_lm[THUMB_TIP][1] - norm_lm[INDEX_TIP][1]
-        dist = (dx**2 + dy**2) ** 0.5
+    def _pinch(self, norm_lm: np.ndarray, st: HandGestureState) -> int:
+        dist = self._pinch_dist(norm_lm)
         if st._prev_pinch is None:
             st._prev_pinch = dist
             return 0
@@ -259,16 +347,21 @@ class GestureEngine:
 
     def _swipe(self, st: HandGestureState, now: float):
         undo = redo = slide_next = slide_prev = False
+        # Timestamps are monotonic, so stale samples are always at the head.
+        hist = st._swipe_history
+        window_start = now - SWIPE_WINDOW
+        while hist and hist[0][0] < window_start:
+            hist.popleft()
         if now - st._last_swipe < 0.55:
             return undo, redo, slide_next, slide_prev
-        window_start = now - SWIPE_WINDOW
-        pts = [(t, x) for t, x in st._swipe_history if t >= window_start]
-        if len(pts) < 4:
+        if len(hist) < 4:
             return undo, redo, slide_next, slide_prev
-        dt = pts[-1][0] - pts[0][0]
+        t0, x0 = hist[0]
+        t1, x1 = hist[-1]
+        dt = t1 - t0
         if dt < 0.05:
             return undo, redo, slide_next, slide_prev
-        dx = pts[-1][1] - pts[0][1]
+        dx = x1 - x0
         vel = dx / dt
         if vel < -SWIPE_VELOCITY_THRESH:
             st._last_swipe = now
@@ -280,5 +373,4 @@ class GestureEngine:
 
     @staticmethod
     def _g_to_fc(g: Gesture) -> int:
-        return {Gesture.OPEN_PALM:5, Gesture.FOUR:4,
-                Gesture.THREE:3, Gesture.TWO:2}.get(g, -1)
+        return _FC_FROM_G[g.value - 1]
@@ -4,8 +4,9 @@ multi_hand_detector.py
 Dual-hand detection using MediaPipe 0.10+ Tasks API.
 
 Returns up to 2 hands. Each hand result includes:
-  • norm_landmarks  : list of 21 (x, y, z) normalised tuples
-  • pixel_landmarks : list of 21 (px, py) at display resolution
+  • norm_lm_arr  : (21, 3) float32 normalised (x, y, z)
+  • pixel_lm_arr : (21, 2) int32 (px, py) at display resolution
+    (norm_lm / pixel_lm give the same data as lists of tuples)
   • handedness      : "Left" or "Right"
 
 Hand assignment:
@@ -36,14 +37,25 @@ from utils.config import (
 
 _MODEL_PATH = os.path.join(os.path.dirname(__file__), MODEL_FILENAME)
 
-_CONNECTIONS = [
-    (0,1),(1,2),(2,3),(3,4),
-    (0,5),(5,6),(6,7),(7,8),
-    (0,9),(9,10),(10,11),(11,12),
-    (0,13),(13,14),(14,15),(15,16),
-    (0,17),(17,18),(18,19),(19,20),
-    (5,9),(9,13),(13,17),
-]
+# Hand skeleton as 5 finger chains plus the knuckle line, so a single
+# cv2.polylines call draws every connection.
+_CHAINS = tuple(np.array(c, dtype=np.intp) for c in (
+    (0, 1, 2, 3, 4), (0, 5, 6, 7, 8), (0, 9, 10, 11, 12),
+    (0, 13, 14, 15, 16), (0, 17, 18, 19, 20), (5, 9, 13, 17),
+))
+
+
+def _dot_offsets() -> tuple[np.ndarray, np.ndarray]:
+    """(dy, dx) offsets of the white fill and coloured ring of a landmark dot."""
+    fill = np.zeros((7, 7), dtype=np.uint8)
+    ring = np.zeros((7, 7), dtype=np.uint8)
+    cv2.circle(fill, (3, 3), 3, 1, cv2.FILLED)
+    cv2.circle(ring, (3, 3), 3, 1, 1)
+    fill[ring > 0] = 0
+    return np.argwhere(fill) - 3, np.argwhere(ring) - 3
+
+
+_DOT_FILL, _DOT_RING = _dot_offsets()
 
 
 def _ensure_model() -> str:
@@ -54,23 +66,52 @@ def _ensure_model() -> str:
     return _MODEL_PATH
 
 
-def _draw_hand(frame: np.ndarray, pixel_lm: list, color: tuple = (0, 190, 90)) -> None:
-    for a, b in _CONNECTIONS:
-        cv2.line(frame, pixel_lm[a], pixel_lm[b], color, 1, cv2.LINE_AA)
-    for pt in pixel_lm:
-        cv2.circle(frame, pt, 3, (255, 255, 255), cv2.FILLED)
-        cv2.circle(frame, pt, 3, color, 1)
+def _draw_hand(frame: np.ndarray, pixel_lm: np.ndarray, color: tuple = (0, 190, 90)) -> None:
+    cv2.polylines(frame, [pixel_lm[c] for c in _CHAINS], False, color, 1, cv2.LINE_AA)
+    _stamp(frame, pixel_lm, _DOT_FILL, (255, 255, 255))
+    _stamp(frame, pixel_lm, _DOT_RING, color)
+
+
+def _stamp(frame: np.ndarray, pts: np.ndarray, offsets: np.ndarray, color: tuple) -> None:
+    """Write `color` at every pts + offsets pixel that lands inside the frame."""
+    ys = (pts[:, 1, None] + offsets[None, :, 0]).ravel()
+    xs = (pts[:, 0, None] + offsets[None, :, 1]).ravel()
+    h, w = frame.shape[:2]
+    ok = (ys >= 0) & (ys < h) & (xs >= 0) & (xs < w)
+    frame[ys[ok], xs[ok]] = color
 
 
 class HandResult:
-    """Holds processed result for one detected hand."""
-    __slots__ = ("norm_lm", "pixel_lm", "handedness", "index_tip")
+    """
+    Holds processed result for one detected hand.
 
-    def __init__(self, norm_lm, pixel_lm, handedness="Right"):
-        self.norm_lm    = norm_lm
-        self.pixel_lm   = pixel_lm
-        self.handedness = handedness
-        self.index_tip  = pixel_lm[INDEX_TIP]
+    Landmarks live in ndarrays (``norm_lm_arr`` (21, 3) float32,
+    ``pixel_lm_arr`` (21, 2) int32). ``norm_lm`` / ``pixel_lm`` expose the
+    same data as lists of tuples, built lazily on first access.
+    """
+    __slots__ = ("norm_lm_arr", "pixel_lm_arr", "handedness", "index_tip",
+                 "_norm_lm", "_pixel_lm")
+
+    def __init__(self, norm_lm_arr, pixel_lm_arr, handedness="Right"):
+        self.norm_lm_arr  = norm_lm_arr
+        self.pixel_lm_arr = pixel_lm_arr
+        self.handedness   = handedness
+        tip = pixel_lm_arr[INDEX_TIP]
+        self.index_tip    = (int(tip[0]), int(tip[1]))
+        self._norm_lm     = None
+        self._pixel_lm    = None
+
+    @property
+    def norm_lm(self) -> list:
+        if self._norm_lm is None:
+            self._norm_lm = [tuple(p) for p in self.norm_lm_arr.tolist()]
+        return self._norm_lm
+
+    @property
+    def pixel_lm(self) -> list:
+        if self._pixel_lm is None:
+            self._pixel_lm = [tuple(p) for p in self.pixel_lm_arr.tolist()]
+        return self._pixel_lm
 
 
 class MultiHandDetector:
@@ -97,14 +138,21 @@ class MultiHandDetector:
         self._landmarker = HandLandmarker.create_from_options(options)
         self._last_hands: list[HandResult] = []
         self._last_ts_ms = 0
+        self._scale = np.array([DISPLAY_WIDTH, DISPLAY_HEIGHT], dtype=np.float32)
+        # Preprocessing buffers reused every frame (detect_for_video is
+        # synchronous, so nothing holds on to them between calls).
+        self._small_bgr = np.empty((DETECT_HEIGHT, DETECT_WIDTH, 3), dtype=np.uint8)
+        self._small_rgb = np.empty((DETECT_HEIGHT, DETECT_WIDTH, 3), dtype=np.uint8)
 
     def process(self, frame: np.ndarray) -> list[HandResult]:
         orig_h, orig_w = frame.shape[:2]
+        if self._scale[0] != orig_w or self._scale[1] != orig_h:
+            self._scale = np.array([orig_w, orig_h], dtype=np.float32)
         if (orig_w, orig_h) != (DETECT_WIDTH, DETECT_HEIGHT):
-            small = cv2.resize(frame, (DETECT_WIDTH, DETECT_HEIGHT))
+            small = cv2.resize(frame, (DETECT_WIDTH, DETECT_HEIGHT), dst=self._small_bgr)
         else:
             small = frame
-        rgb   = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
+        rgb   = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._small_rgb)
         mp_img = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
         ts_ms = int(time.monotonic() * 1000)
         if ts_ms <= self._last_ts_ms:
@@ -122,9 +170,12 @@ class MultiHandDetector:
             if result.handedness and i < len(result.handedness):
                 handedness = result.handedness[i][0].display_name
 
-            norm_lm  = [(lm.x, lm.y, lm.z) for lm in hand_lm]
-            pixel_lm = [(int(lm.x * orig_w), int(lm.y * orig_h)) for lm in hand_lm]
-            hands.append(HandResult(norm_lm, pixel_lm, handedness))
+            norm_arr = np.fromiter(
+                (v for lm in hand_lm for v in (lm.x, lm.y, lm.z)),
+                dtype=np.float32, count=len(hand_lm) * 3,
+            ).reshape(-1, 3)
+            pixel_arr = (norm_arr[:, :2] * self._scale).astype(np.int32)
+            hands.append(HandResult(norm_arr, pixel_arr, handedness))
 
         self._last_hands = hands
         return hands
@@ -132,7 +183,7 @@ class MultiHandDetector:
     def draw_landmarks(self, frame: np.ndarray, hands: list[HandResult]) -> None:
         colors = [(0, 200, 100), (100, 100, 255)]
         for i, h in enumerate(hands):
-            _draw_hand(frame, h.pixel_lm, colors[i % 2])
+            _draw_hand(frame, h.pixel_lm_arr, colors[i % 2])
             # Label hand
             tip = h.index_tip
             cv2.putText(frame, f"H{i+1}:{h.handedness[0]}",
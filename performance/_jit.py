@@ -0,0 +1,36 @@
+"""
+_jit.py
+-------
+Array hot-path helpers, compiled with Numba when it is installed.
+Falls back to numpy so Numba stays an optional dependency.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def frame_energy(samples) -> float:
+        """Mean square of a 1-D PCM sample array (RMS squared)."""
+        n = samples.size
+        if n == 0:
+            return 0.0
+        s = 0.0
+        for i in range(n):
+            v = float(samples[i])
+            s += v * v
+        return s / n
+else:
+    def frame_energy(samples) -> float:
+        """Mean square of a 1-D PCM sample array (RMS squared)."""
+        if samples.size == 0:
+            return 0.0
+        return float(np.mean(samples.astype(np.float64) ** 2))
@@ -3,6 +3,7 @@ from __future__ import annotations
 import time
 import cv2
 import numpy as np
+from ui._text import draw_text
 from utils.config import UI_ACCENT2
 
 
@@ -20,9 +21,9 @@ class FPSOptimizer:
         return self._fps
 
     def draw(self, frame: np.ndarray):
+        # Outline and label come from the shared text-mask cache in one blend
         t = f"FPS {self._fps:.0f}"
-        cv2.putText(frame,t,(12,32),cv2.FONT_HERSHEY_SIMPLEX,0.58,(0,0,0),3,cv2.LINE_AA)
-        cv2.putText(frame,t,(12,32),cv2.FONT_HERSHEY_SIMPLEX,0.58,UI_ACCENT2,1,cv2.LINE_AA)
+        draw_text(frame,t,(12,32),cv2.FONT_HERSHEY_SIMPLEX,0.58,UI_ACCENT2,1,shadow=(0,0,3))
 
     @property
     def fps(self): return self._fps
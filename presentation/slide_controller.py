@@ -16,7 +16,7 @@ Features
 from __future__ import annotations
 
 import os
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import cv2
@@ -29,6 +29,12 @@ from utils.config import (
 )
 
 
+_EXT_SET = frozenset(e.lower() for e in SLIDE_EXTENSIONS)
+
+# Alpha 0..255 -> Q8 weight 0..256 for the integer annotation blend.
+_ALPHA_Q8 = ((np.arange(256, dtype=np.uint32) * 256 + 127) // 255).astype(np.uint16)
+
+
 class SlideController:
     """
     Manages a folder-based image slideshow.
@@ -48,6 +54,16 @@ class SlideController:
         self._loaded:  bool  = False
         self._laser:   bool  = False
         self._annotations: dict[int, np.ndarray] = {}  # per-slide canvas
+        # slide index -> (source canvas, roi, Q8 premultiplied BGR, 256-w), or
+        # (source canvas, None, None, None) when the canvas is fully transparent.
+        self._ann_cache: dict[int, tuple] = {}
+        self._build_laser_sprite()
+        # Reused output buffer; the caller draws HUD overlays onto whatever
+        # render() returns, so each frame must start from a clean slide copy.
+        self._frame_buf: Optional[np.ndarray] = None
+        # (index, count) -> (opaque counter strip, (x, y) top-left)
+        self._counter_cache: dict[tuple[int, int], tuple[np.ndarray, tuple]] = {}
+        self._placeholder_img: Optional[np.ndarray] = None
 
     # ── Load ──────────────────────────────────────────────────────────────────
 
@@ -59,23 +75,37 @@ class SlideController:
             print(f"[SLIDES] Folder not found: {folder}")
             return 0
 
-        paths = []
-        for ext in SLIDE_EXTENSIONS:
-            paths += glob.glob(os.path.join(folder, f"*{ext}"))
-            paths += glob.glob(os.path.join(folder, f"*{ext.upper()}"))
-        paths = sorted(set(paths))
+        with os.scandir(folder) as it:
+            paths = sorted(
+                e.path for e in it
+                if e.is_file() and os.path.splitext(e.name)[1].lower() in _EXT_SET
+            )
 
-        for p in paths:
-            img = cv2.imread(p)
-            if img is not None:
-                img = cv2.resize(img, (DISPLAY_WIDTH, DISPLAY_HEIGHT))
-                self._slides.append(img)
+        # Decode and resize release the GIL, so both run on a pool. Slides
+        # are resized straight into one contiguous (N, H, W, 3) block.
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as ex:
+            raw = [img for img in ex.map(self._read_slide, paths) if img is not None]
+            block = np.empty((len(raw), DISPLAY_HEIGHT, DISPLAY_WIDTH, 3), dtype=np.uint8)
+            list(ex.map(self._fit_slide, raw, block))
+        self._slides = list(block)
 
         self._index  = 0
         self._loaded = len(self._slides) > 0
         print(f"[SLIDES] Loaded {len(self._slides)} slides from {folder}")
         return len(self._slides)
 
+    @staticmethod
+    def _read_slide(path: str) -> Optional[np.ndarray]:
+        try:
+            buf = np.fromfile(path, dtype=np.uint8)
+        except OSError:
+            return None
+        return cv2.imdecode(buf, cv2.IMREAD_COLOR)
+
+    @staticmethod
+    def _fit_slide(img: np.ndarray, dst: np.ndarray) -> None:
+        cv2.resize(img, (DISPLAY_WIDTH, DISPLAY_HEIGHT), dst=dst)
+
     def load_dialog(self) -> None:
         """Open folder picker in background thread."""
         import threading
@@ -128,18 +158,16 @@ class SlideController:
         laser_mode:  bool,
     ) -> np.ndarray:
         """Render slide (or placeholder) with pointer and counter overlay."""
-        if self._slides:
-            frame = self._slides[self._index].copy()
-        else:
-            frame = self._placeholder()
+        slide = self._slides[self._index] if self._slides else self._placeholder()
+        frame = self._frame_buf
+        if frame is None or frame.shape != slide.shape:
+            frame = self._frame_buf = np.empty_like(slide)
+        np.copyto(frame, slide)
 
         # Per-slide annotation layer
-        if self._index in self._annotations:
-            ann = self._annotations[self._index]
-            b,g,r,a = cv2.split(ann)
-            af  = a.astype(np.float32)/255.0
-            for i,ch in enumerate([b,g,r]):
-                frame[:,:,i] = (frame[:,:,i]*(1-af)+ch*af).astype(np.uint8)
+        ann = self._annotations.get(self._index)
+        if ann is not None:
+            self._blend_annotation(frame, ann)
 
         # Laser pointer
         if laser_mode and fingertip:
@@ -152,6 +180,8 @@ class SlideController:
 
     def get_annotation_canvas(self) -> np.ndarray:
         """Return (or create) per-slide BGRA annotation canvas."""
+        # Caller may draw into the returned array, so drop its blend cache.
+        self._ann_cache.pop(self._index, None)
         if self._index not in self._annotations:
             self._annotations[self._index] = np.zeros(
                 (DISPLAY_HEIGHT, DISPLAY_WIDTH, 4), dtype=np.uint8
@@ -160,30 +190,116 @@ class SlideController:
 
     def set_annotation_canvas(self, canvas: np.ndarray) -> None:
         self._annotations[self._index] = canvas
+        self._ann_cache.pop(self._index, None)
 
     # ── Internals ─────────────────────────────────────────────────────────────
 
+    def _blend_annotation(self, frame: np.ndarray, ann: np.ndarray) -> None:
+        cached = self._ann_cache.get(self._index)
+        if cached is None or cached[0] is not ann:
+            cached = self._prepare_annotation(ann)
+            self._ann_cache[self._index] = cached
+        _, roi, premul, inv = cached
+        if roi is None:
+            return
+        x1, y1, x2, y2 = roi
+        dst = frame[y1:y2, x1:x2]
+        out = dst * inv           # uint16: 255*256 + 128 still fits
+        out += premul
+        out >>= 8
+        dst[:] = out
+
+    @staticmethod
+    def _prepare_annotation(ann: np.ndarray) -> tuple:
+        """
+        Precompute Q8 integer blend terms over the annotation's non-empty
+        bbox: out = (frame * (256 - w) + bgr * w + 128) >> 8.
+        """
+        nz = cv2.findNonZero(ann[:, :, 3])
+        if nz is None:
+            return ann, None, None, None
+        x, y, w, h = cv2.boundingRect(nz)
+        sub = ann[y:y+h, x:x+w]
+        wq8 = _ALPHA_Q8[sub[:, :, 3]][:, :, None]
+        premul = sub[:, :, :3] * wq8
+        premul += 128             # rounding bias folded in once
+        return ann, (x, y, x+w, y+h), premul, 256 - wq8
+
+    _LASER_GLOW = ((20, 40), (14, 80), (LASER_RADIUS, 160))   # (radius, alpha)
+
+    def _build_laser_sprite(self) -> None:
+        """
+        Collapse the glow rings and centre dot into one sprite:
+        out = frame * trans + term, over a (2r+1)² patch.
+        """
+        r = max(rad for rad, _ in self._LASER_GLOW)
+        size = 2 * r + 1
+        trans = np.ones((size, size), dtype=np.float32)
+        mask = np.zeros((size, size), dtype=np.uint8)
+        for rad, a in self._LASER_GLOW:
+            mask[:] = 0
+            cv2.circle(mask, (r, r), rad, 255, cv2.FILLED)
+            trans[mask > 0] *= 1.0 - a / 255.0
+        term = np.empty((size, size, 3), dtype=np.float32)
+        term[:] = LASER_COLOR
+        term *= (1.0 - trans)[:, :, None]
+        mask[:] = 0
+        cv2.circle(mask, (r, r), 4, 255, cv2.FILLED)
+        trans[mask > 0] = 0.0
+        term[mask > 0] = 255.0
+        self._laser_r = r
+        self._laser_trans = trans[:, :, None]
+        self._laser_term = term
+
     def _draw_laser(self, frame: np.ndarray, pt: tuple) -> None:
         x, y = pt
-        # Outer glow
-        for r, a in [(20, 40), (14, 80), (LASER_RADIUS, 160)]:
-            overlay = frame.copy()
-            cv2.circle(overlay, (x,y), r, LASER_COLOR, cv2.FILLED)
-            cv2.addWeighted(overlay, a/255.0, frame, 1-a/255.0, 0, frame)
-        cv2.circle(frame, (x,y), 4, (255,255,255), cv2.FILLED)
+        r = self._laser_r
+        h, w = frame.shape[:2]
+        x0, y0 = max(0, x - r), max(0, y - r)
+        x1, y1 = min(w, x + r + 1), min(h, y + r + 1)
+        if x0 >= x1 or y0 >= y1:
+            return
+        sx, sy = x0 - (x - r), y0 - (y - r)
+        sw, sh = x1 - x0, y1 - y0
+        dst = frame[y0:y1, x0:x1]
+        out = dst * self._laser_trans[sy:sy+sh, sx:sx+sw]
+        out += self._laser_term[sy:sy+sh, sx:sx+sw]
+        dst[:] = out
 
     def _draw_counter(self, frame: np.ndarray) -> None:
         if not self._slides:
             return
-        text = f"  {self._index+1} / {len(self._slides)}  "
+        key = (self._index, len(self._slides))
+        cached = self._counter_cache.get(key)
+        if cached is None:
+            cached = self._render_counter(*key)
+            self._counter_cache[key] = cached
+        strip, (x0, y0) = cached
+        h, w = strip.shape[:2]
+        frame[y0:y0+h, x0:x0+w] = strip
+
+    @staticmethod
+    def _render_counter(index: int, count: int) -> tuple[np.ndarray, tuple]:
+        """Rasterise the counter pill once; it is opaque, so a plain copy blits it."""
+        text = f"  {index+1} / {count}  "
         font, scale = cv2.FONT_HERSHEY_SIMPLEX, 0.55
         (tw,th),_   = cv2.getTextSize(text, font, scale, 1)
         x = (DISPLAY_WIDTH - tw)//2
         y = DISPLAY_HEIGHT - 14
-        cv2.rectangle(frame, (x-6,y-th-4),(x+tw+6,y+6), UI_PANEL, cv2.FILLED)
-        cv2.putText(frame, text, (x,y), font, scale, UI_ACCENT, 1, cv2.LINE_AA)
+        x0, y0 = x - 6, y - th - 4
+        strip = np.empty((th + 11, tw + 13, 3), dtype=np.uint8)
+        strip[:] = UI_PANEL
+        cv2.putText(strip, text, (6, th + 4), font, scale, UI_ACCENT, 1, cv2.LINE_AA)
+        return strip, (x0, y0)
 
     def _placeholder(self) -> np.ndarray:
+        """Static 'no slides' card, rendered once; render() copies it out."""
+        if self._placeholder_img is None:
+            self._placeholder_img = self._build_placeholder()
+        return self._placeholder_img
+
+    @staticmethod
+    def _build_placeholder() -> np.ndarray:
         frame = np.zeros((DISPLAY_HEIGHT, DISPLAY_WIDTH, 3), dtype=np.uint8)
         frame[:] = (18, 18, 24)
         lines = [
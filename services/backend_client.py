@@ -2,14 +2,52 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class BackendClientError(RuntimeError):
     """Raised when API calls fail."""
 
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class BackendClientPermanentError(BackendClientError):
+    """Raised for 4xx responses (other than 429) that retrying cannot fix."""
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _http_error(message: str, response: requests.Response) -> BackendClientError:
+    status = response.status_code
+    cls = BackendClientPermanentError if 400 <= status < 500 and status != 429 else BackendClientError
+    return cls(message, status_code=status, retry_after=_retry_after(response.headers.get("Retry-After")))
+
 
 @dataclass(frozen=True)
 class BackendClientConfig:
@@ -23,16 +61,30 @@ class BackendClient:
         self._base_url = config.base_url.rstrip("/")
         self._token = config.jwt_token
         self._timeout = max(1.0, float(config.timeout_sec))
+        # Keep-alive pools: one for the API (carries auth), one for signed
+        # object-store URLs (must not leak the bearer token to that host).
+        self._session = self._new_session()
+        self._session.headers["Authorization"] = f"Bearer {self._token}"
+        self._upload_session = self._new_session()
+
+    @staticmethod
+    def _new_session() -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        self._session.close()
+        self._upload_session.close()
 
     @property
     def enabled(self) -> bool:
         return bool(self._base_url and self._token)
 
     def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self._token}",
-            "Content-Type": "application/json",
-        }
+        return {"Content-Type": "application/json"}
 
     def _request(self, method: str, path: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
         if not self.enabled:
@@ -40,7 +92,7 @@ class BackendClient:
 
         url = f"{self._base_url}{path}"
         try:
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=url,
                 json=payload,
@@ -52,7 +104,7 @@ class BackendClient:
 
         if not response.ok:
             detail = response.text.strip()
-            raise BackendClientError(f"{method} {url} failed [{response.status_code}] {detail}")
+            raise _http_error(f"{method} {url} failed [{response.status_code}] {detail}", response)
 
         try:
             return response.json()
@@ -77,27 +129,52 @@ class BackendClient:
         session_id: str | None,
         brush_mode: str,
         shape_mode: str,
+        frame_extension: str = "png",
     ) -> dict[str, Any]:
         payload = {
             "session_id": session_id,
             "brush_mode": brush_mode,
             "shape_mode": shape_mode,
-            "frame_extension": "png",
+            "frame_extension": frame_extension,
             "thumbnail_extension": "jpg",
         }
         return self._request("POST", "/api/v1/frames/upload-url", payload=payload)
 
+    def request_upload_urls_batch(
+        self,
+        session_id: str | None,
+        modes: list[tuple[str, str]],
+        frame_extension: str = "png",
+    ) -> list[dict[str, Any]]:
+        """One round trip for several frames; `modes` is [(brush_mode, shape_mode), ...]."""
+        items = [
+            {
+                "session_id": session_id,
+                "brush_mode": brush_mode,
+                "shape_mode": shape_mode,
+                "frame_extension": frame_extension,
+                "thumbnail_extension": "jpg",
+            }
+            for brush_mode, shape_mode in modes
+        ]
+        data = self._request("POST", "/api/v1/frames/upload-url/batch", payload={"items": items})
+        return list(data["items"])
+
     def complete_upload(self, frame_id: str) -> dict[str, Any]:
         return self._request("POST", f"/api/v1/frames/{frame_id}/complete", payload={})
 
+    def complete_upload_batch(self, frame_ids: list[str]) -> list[dict[str, Any]]:
+        data = self._request("POST", "/api/v1/frames/complete/batch", payload={"frame_ids": frame_ids})
+        return list(data["items"])
+
     def upload_bytes_to_signed_url(
         self,
         url: str,
-        content: bytes,
+        content: bytes | memoryview,
         content_type: str,
     ) -> None:
         try:
-            response = requests.put(
+            response = self._upload_session.put(
                 url,
                 data=content,
                 headers={"Content-Type": content_type},
@@ -107,7 +184,8 @@ class BackendClient:
             raise BackendClientError(f"Signed URL upload failed: {exc}") from exc
 
         if response.status_code not in (200, 201):
-            raise BackendClientError(
-                f"Signed URL upload failed [{response.status_code}] {response.text[:200]}"
+            raise _http_error(
+                f"Signed URL upload failed [{response.status_code}] {response.text[:200]}",
+                response,
             )
 
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import logging
+import logging.handlers
 import os
 import queue
+import random
+import sys
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 
 import cv2
@@ -17,14 +22,63 @@ from utils.config import (
     AUTO_CAPTURE_INTERVAL_SEC,
     FRAME_UPLOAD_FALLBACK_DIR,
     FRAME_UPLOAD_LOCAL_FALLBACK,
+    FRAME_IMAGE_FORMAT,
+    FRAME_IMAGE_QUALITY,
     FRAME_PNG_COMPRESSION,
     FRAME_THUMB_JPEG_QUALITY,
     FRAME_THUMB_MAX_WIDTH,
+    FRAME_UPLOAD_BATCH_LIMIT,
+    FRAME_UPLOAD_BATCH_MAX,
     FRAME_UPLOAD_QUEUE_SIZE,
     FRAME_UPLOAD_RETRY_BACKOFF_SEC,
     FRAME_UPLOAD_RETRY_MAX,
 )
-from services.backend_client import BackendClient, BackendClientConfig, BackendClientError
+from services.backend_client import (
+    BackendClient,
+    BackendClientConfig,
+    BackendClientError,
+    BackendClientPermanentError,
+)
+
+_RETRY_BACKOFF_CAP_SEC = 30.0
+
+_log = logging.getLogger("aircanvas.upload")
+
+
+def start_log_listener() -> logging.handlers.QueueListener:
+    """
+    Route uploader logs through an unbounded queue drained on its own thread.
+
+    The upload worker only enqueues records, so it never takes the stdout lock
+    or waits on a flush. Call once at startup; stop the listener on shutdown.
+    """
+    records: queue.Queue = queue.Queue(-1)
+    sink = logging.StreamHandler(sys.stdout)
+    sink.setFormatter(logging.Formatter("[UPLOAD] %(message)s"))
+    listener = logging.handlers.QueueListener(records, sink)
+    _log.handlers[:] = [logging.handlers.QueueHandler(records)]
+    _log.setLevel(logging.INFO)
+    _log.propagate = False
+    listener.start()
+    return listener
+
+
+# format -> (imencode extension, content type, imencode params)
+_PRIMARY_FORMATS = {
+    "png":  (".png",  "image/png",  [cv2.IMWRITE_PNG_COMPRESSION, int(FRAME_PNG_COMPRESSION)]),
+    "webp": (".webp", "image/webp", [cv2.IMWRITE_WEBP_QUALITY, int(FRAME_IMAGE_QUALITY)]),
+    "jpg":  (".jpg",  "image/jpeg", [cv2.IMWRITE_JPEG_QUALITY, int(FRAME_IMAGE_QUALITY)]),
+}
+
+# Thumbnail params are fixed too; 4:2:0 chroma (where this cv2 build exposes
+# the flag) shrinks the thumb and shortens the encode. Baseline, not progressive.
+_THUMB_PARAMS = [
+    cv2.IMWRITE_JPEG_QUALITY, int(FRAME_THUMB_JPEG_QUALITY),
+    cv2.IMWRITE_JPEG_OPTIMIZE, 1,
+    cv2.IMWRITE_JPEG_PROGRESSIVE, 0,
+]
+if hasattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR"):
+    _THUMB_PARAMS += [cv2.IMWRITE_JPEG_SAMPLING_FACTOR, cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420]
 
 
 @dataclass
@@ -33,6 +87,77 @@ class _FrameJob:
     brush_mode: str
     shape_mode: str
     attempt: int = 0
+    # (primary, thumbnail) encode futures; kept so retries reuse the bytes.
+    encodes: tuple[Future, Future] | None = None
+    # Signed URLs already issued for this frame (the server row exists), and
+    # whether both PUTs landed; retries resume from there instead of
+    # requesting new URLs and creating a duplicate frame row.
+    payload: dict | None = None
+    uploaded: bool = False
+
+
+class _FrameRing:
+    """
+    Single-producer / single-consumer ring of preallocated frame slots.
+
+    The capture loop is the only writer of ``_head`` and the upload worker the
+    only writer of ``_tail``; plain int rebinding is atomic under the GIL, so
+    neither side takes a lock. A full ring rejects the frame instead of
+    blocking the producer.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        # Power-of-two capacity so slot indices are a mask, not a modulo.
+        self._capacity = 1 << (max(2, int(capacity)) - 1).bit_length()
+        self._mask = self._capacity - 1
+        self._slots: list[np.ndarray | None] = [None] * self._capacity
+        self._meta: list[tuple[str, str]] = [("", "")] * self._capacity
+        self._head = 0
+        self._tail = 0
+
+    def __len__(self) -> int:
+        return self._head - self._tail
+
+    def empty(self) -> bool:
+        return self._head == self._tail
+
+    def push(self, frame: np.ndarray, brush_mode: str, shape_mode: str, *, copy: bool = True) -> bool:
+        head = self._head
+        if head - self._tail >= self._capacity:
+            return False
+        i = head & self._mask
+        if not copy:
+            # Caller handed the array over; the slot adopts it as-is.
+            self._slots[i] = frame
+        else:
+            slot = self._slots[i]
+            if slot is None or slot.shape != frame.shape or slot.dtype != frame.dtype:
+                # Slot is free (head - tail < capacity), so resizing it is safe.
+                slot = np.empty_like(frame)
+                self._slots[i] = slot
+            np.copyto(slot, frame)
+        self._meta[i] = (brush_mode, shape_mode)
+        self._head = head + 1  # publish only after the slot is fully written
+        return True
+
+    def peek(self) -> _FrameJob | None:
+        """Return the oldest job without releasing its slot."""
+        jobs = self.peek_many(1)
+        return jobs[0] if jobs else None
+
+    def peek_many(self, limit: int) -> list[_FrameJob]:
+        """Return up to `limit` oldest jobs, oldest first, without releasing them."""
+        tail = self._tail
+        jobs = []
+        for pos in range(tail, min(self._head, tail + limit)):
+            i = pos & self._mask
+            brush_mode, shape_mode = self._meta[i]
+            jobs.append(_FrameJob(frame=self._slots[i], brush_mode=brush_mode, shape_mode=shape_mode))
+        return jobs
+
+    def release(self, count: int = 1) -> None:
+        """Hand the oldest `count` slots back to the producer."""
+        self._tail += count
 
 
 class FrameUploader:
@@ -54,20 +179,33 @@ class FrameUploader:
         fallback_dir: str = FRAME_UPLOAD_FALLBACK_DIR,
     ) -> None:
         self._client = client
-        self._queue: queue.Queue[_FrameJob] = queue.Queue(maxsize=max(2, int(queue_size)))
+        self._ring = _FrameRing(queue_size)
+        self._wake = threading.Event()
+        self._stopping = threading.Event()   # set by stop(); cuts retry backoff short
+        self._drained = threading.Condition()
         self._max_retries = max(0, int(max_retries))
         self._retry_backoff = max(0.1, float(retry_backoff_sec))
         self._local_fallback_enabled = bool(local_fallback_enabled)
         self._fallback_dir = fallback_dir.strip() or "saves"
+        self._format = FRAME_IMAGE_FORMAT if FRAME_IMAGE_FORMAT in _PRIMARY_FORMATS else "png"
+        self._batch_max = min(FRAME_UPLOAD_BATCH_LIMIT, max(1, int(FRAME_UPLOAD_BATCH_MAX)))
+        self._batch_supported = True   # cleared if the backend lacks the batch routes
+        # Encodes run here so they overlap the upload-URL round trip; the
+        # thumbnail PUT then runs here alongside the full-size PUT.
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="FrameUpload")
 
         self._running = False
+        self._accepting = False   # cleared first on stop(); enqueue_frame checks it
         self._worker = threading.Thread(target=self._run, daemon=True)
         self._session_id: str | None = None
         self._lock = threading.Lock()
 
         self.auto_capture_enabled = AUTO_CAPTURE_DEFAULT_ENABLED
         self.auto_capture_interval_sec = AUTO_CAPTURE_INTERVAL_SEC
-        self._last_auto_capture_ts = 0.0
+        # Integer monotonic clock: the per-frame check is one subtraction and
+        # compare, and an interval change applies from the last capture on.
+        self._auto_interval_ns = int(max(1.0, float(AUTO_CAPTURE_INTERVAL_SEC)) * 1e9)
+        self._last_auto_capture_ns: int | None = None
 
     @classmethod
     def from_env(cls) -> FrameUploader | None:
@@ -93,44 +231,70 @@ class FrameUploader:
         if not self.enabled or self._running:
             return
         self._running = True
+        self._accepting = True
         self._worker.start()
 
     def stop(self, avg_fps: float | None = None, flush_timeout_sec: float = 4.0) -> None:
         if not self._running:
             return
 
-        end_at = time.time() + max(0.5, float(flush_timeout_sec))
-        while time.time() < end_at and not self._queue.empty():
-            time.sleep(0.05)
+        self._accepting = False
+        flush_timeout = max(0.5, float(flush_timeout_sec))
+        with self._drained:
+            self._drained.wait_for(self._ring.empty, timeout=flush_timeout)
 
+        # With _running cleared the worker stops retrying and spills whatever
+        # is still queued to the local fallback, so only the request in flight
+        # can hold it up. It still uses the pool and the session, so leave
+        # those alone if it has not exited in time.
         self._running = False
-        self._worker.join(timeout=2.0)
+        self._stopping.set()
+        self._wake.set()
+        self._worker.join(timeout=flush_timeout + float(AIRCANVAS_API_TIMEOUT_SEC))
+        if self._worker.is_alive():
+            _log.warning("Upload worker still busy at shutdown; skipping session close.")
+            return
+        self._pool.shutdown(wait=True)
 
         session_id = self._session_id
         if session_id:
             try:
                 self._client.end_session(session_id=session_id, avg_fps=avg_fps)
             except BackendClientError as exc:
-                print(f"[UPLOAD] Failed to close session: {exc}")
+                _log.warning("Failed to close session: %s", exc)
+        self._client.close()
 
-    def enqueue_frame(self, frame: np.ndarray, brush_mode: str, shape_mode: str) -> bool:
-        if not self.enabled:
+    def enqueue_frame(
+        self,
+        frame: np.ndarray,
+        brush_mode: str,
+        shape_mode: str,
+        *,
+        copy: bool = True,
+    ) -> bool:
+        """
+        Queue `frame` for upload; returns False if disabled or the ring is full.
+
+        With ``copy=False`` the ring keeps a reference to `frame` instead of
+        copying it into a slot. The caller transfers ownership: the array must
+        not be written to (or reused as a buffer) after the call, since the
+        upload worker may still be encoding it.
+        """
+        if not self.enabled or not self._accepting:
             return False
-        job = _FrameJob(frame=frame.copy(), brush_mode=brush_mode, shape_mode=shape_mode)
-        try:
-            self._queue.put_nowait(job)
-            return True
-        except queue.Full:
+        if not self._ring.push(frame, brush_mode, shape_mode, copy=copy):
             return False
+        self._wake.set()
+        return True
 
     def should_auto_capture_now(self) -> bool:
         if not self.auto_capture_enabled:
             return False
-        now = time.time()
-        interval = max(1.0, float(self.auto_capture_interval_sec))
-        if now - self._last_auto_capture_ts < interval:
+        now_ns = time.monotonic_ns()
+        last = self._last_auto_capture_ns
+        if last is not None and now_ns - last < self._auto_interval_ns:
             return False
-        self._last_auto_capture_ts = now
+        self._last_auto_capture_ns = now_ns
         return True
 
     def toggle_auto_capture(self) -> bool:
@@ -139,33 +303,114 @@ class FrameUploader:
 
     def set_auto_capture_interval(self, seconds: float) -> None:
         self.auto_capture_interval_sec = max(1.0, float(seconds))
+        self._auto_interval_ns = int(self.auto_capture_interval_sec * 1e9)
 
     def queue_size(self) -> int:
-        return self._queue.qsize()
+        return len(self._ring)
 
     def _run(self) -> None:
         self._ensure_session()
-        while self._running or not self._queue.empty():
-            try:
-                job = self._queue.get(timeout=0.2)
-            except queue.Empty:
+        while self._running or not self._ring.empty():
+            jobs = self._ring.peek_many(self._batch_max if self._batch_supported else 1)
+            if not jobs:
+                # No timeout: enqueue_frame() and stop() both set the event,
+                # and the ring is re-checked after clear(), so nothing is missed.
+                self._wake.wait()
+                self._wake.clear()
                 continue
 
+            # Slots stay owned by the worker until release(), so retries happen
+            # in place and the capture loop never has to re-queue anything.
+            try:
+                if not self._running:
+                    # Shutting down: keep the backlog on disk, off the network.
+                    for job in jobs:
+                        self._save_local_fallback(job)
+                    continue
+                if len(jobs) > 1 and self._upload_batch(jobs):
+                    continue
+                for job in jobs:
+                    self._upload_with_retries(job)
+            finally:
+                self._ring.release(len(jobs))
+                if self._ring.empty():
+                    with self._drained:
+                        self._drained.notify_all()
+
+    def _upload_with_retries(self, job: _FrameJob) -> None:
+        while True:
             try:
                 self._upload_job(job)
+                return
             except Exception as exc:
-                if job.attempt < self._max_retries and self._running:
+                if (job.attempt < self._max_retries and self._running
+                        and not isinstance(exc, BackendClientPermanentError)):
                     job.attempt += 1
-                    time.sleep(self._retry_backoff * (2 ** (job.attempt - 1)))
-                    try:
-                        self._queue.put_nowait(job)
-                    except queue.Full:
-                        print("[UPLOAD] Queue full; dropping retried frame.")
-                else:
-                    print(f"[UPLOAD] Dropped frame after retries: {exc}")
-                    self._save_local_fallback(job)
-            finally:
-                self._queue.task_done()
+                    if not self._stopping.wait(self._retry_delay(job.attempt, exc)):
+                        continue
+                _log.warning("Dropped frame after retries: %s", exc)
+                self._save_local_fallback(job)
+                return
+
+    def _upload_batch(self, jobs: list[_FrameJob]) -> bool:
+        """
+        Upload a backlog with one URL request and one complete request.
+        Returns False (caller falls back to per-frame uploads with retries)
+        if any step fails; jobs keep whatever URLs and PUTs already succeeded.
+        """
+        if not self._session_id:
+            self._ensure_session()
+        for job in jobs:
+            self._start_encodes(job)
+        puts: list[Future] = []
+        try:
+            try:
+                payloads = self._client.request_upload_urls_batch(
+                    session_id=self._session_id,
+                    modes=[(job.brush_mode, job.shape_mode) for job in jobs],
+                    frame_extension=self._format,
+                )
+            except BackendClientPermanentError as exc:
+                if exc.status_code in (404, 405):
+                    _log.info("Backend has no batch upload route; sending frames one by one.")
+                    self._batch_supported = False
+                raise
+            if len(payloads) != len(jobs):
+                raise BackendClientError(f"Expected {len(jobs)} upload URLs, got {len(payloads)}")
+            for job, payload in zip(jobs, payloads):
+                job.payload = payload
+            for job in jobs:
+                frame_bytes, content_type = job.encodes[0].result()
+                puts.append(self._pool.submit(
+                    self._client.upload_bytes_to_signed_url,
+                    job.payload["thumbnail_upload_url"], job.encodes[1].result(),
+                    content_type="image/jpeg",
+                ))
+                puts.append(self._pool.submit(
+                    self._client.upload_bytes_to_signed_url,
+                    job.payload["frame_upload_url"], frame_bytes,
+                    content_type=content_type,
+                ))
+            wait(puts)
+            for job, thumb_put, frame_put in zip(jobs, puts[0::2], puts[1::2]):
+                job.uploaded = thumb_put.exception() is None and frame_put.exception() is None
+            for put in puts:
+                put.result()
+            self._client.complete_upload_batch([str(job.payload["frame_id"]) for job in jobs])
+            return True
+        except Exception as exc:
+            # Encoders and PUTs may still be running; let them finish first.
+            wait(puts + [f for job in jobs for f in job.encodes])
+            _log.warning("Batch upload failed, retrying per frame: %s", exc)
+            return False
+
+    def _retry_delay(self, attempt: int, exc: Exception) -> float:
+        """Server's Retry-After if given, else capped exponential backoff with full jitter."""
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None:
+            return min(float(retry_after), _RETRY_BACKOFF_CAP_SEC)
+        ceiling = min(_RETRY_BACKOFF_CAP_SEC, self._retry_backoff * (2 ** (attempt - 1)))
+        return random.uniform(0.0, ceiling)
 
     def _ensure_session(self) -> None:
         if self._session_id or not self.enabled:
@@ -174,48 +419,78 @@ class FrameUploader:
             session_id = self._client.start_session()
             with self._lock:
                 self._session_id = session_id
-            print(f"[UPLOAD] Session started: {session_id}")
+            _log.info("Session started: %s", session_id)
         except BackendClientError as exc:
-            print(f"[UPLOAD] Could not start remote session yet: {exc}")
+            _log.warning("Could not start remote session yet: %s", exc)
+
+    def _start_encodes(self, job: _FrameJob) -> None:
+        if job.encodes is None:
+            job.encodes = (
+                self._pool.submit(self._encode_primary, job.frame, self._format),
+                self._pool.submit(self._encode_thumbnail, job.frame),
+            )
 
     def _upload_job(self, job: _FrameJob) -> None:
         if not self._session_id:
             self._ensure_session()
 
-        payload = self._client.request_upload_urls(
-            session_id=self._session_id,
-            brush_mode=job.brush_mode,
-            shape_mode=job.shape_mode,
-        )
+        if not job.uploaded:
+            self._put_frame(job)
+        self._client.complete_upload(str(job.payload["frame_id"]))
 
-        png_bytes = self._encode_png(job.frame)
-        thumb_bytes = self._encode_thumbnail(job.frame)
+    def _put_frame(self, job: _FrameJob) -> None:
+        self._start_encodes(job)
+        primary, thumb = job.encodes
 
-        self._client.upload_bytes_to_signed_url(
-            payload["frame_upload_url"],
-            png_bytes,
-            content_type="image/png",
-        )
-        self._client.upload_bytes_to_signed_url(
+        if job.payload is None:
+            try:
+                job.payload = self._client.request_upload_urls(
+                    session_id=self._session_id,
+                    brush_mode=job.brush_mode,
+                    shape_mode=job.shape_mode,
+                    frame_extension=self._format,
+                )
+            except BaseException:
+                # The encoders still read job.frame; its slot must not be released yet.
+                wait((primary, thumb))
+                raise
+        payload = job.payload
+
+        frame_bytes, content_type = primary.result()
+        thumb_bytes = thumb.result()
+
+        thumb_put = self._pool.submit(
+            self._client.upload_bytes_to_signed_url,
             payload["thumbnail_upload_url"],
             thumb_bytes,
             content_type="image/jpeg",
         )
-        self._client.complete_upload(str(payload["frame_id"]))
+        try:
+            self._client.upload_bytes_to_signed_url(
+                payload["frame_upload_url"],
+                frame_bytes,
+                content_type=content_type,
+            )
+        finally:
+            wait((thumb_put,))
+        thumb_put.result()
+        job.uploaded = True
+
+    # Encoders hand back a 1-D memoryview over cv2.imencode's output array:
+    # requests sends any buffer directly, so no extra .tobytes() copy.
+    # imencode drops the GIL inside libpng/libjpeg, and the params lists are
+    # module-level, so these run alongside the drawing loop with no Python prep.
 
     @staticmethod
-    def _encode_png(frame: np.ndarray) -> bytes:
-        ok, encoded = cv2.imencode(
-            ".png",
-            frame,
-            [cv2.IMWRITE_PNG_COMPRESSION, int(FRAME_PNG_COMPRESSION)],
-        )
+    def _encode_primary(frame: np.ndarray, fmt: str) -> tuple[memoryview, str]:
+        ext, content_type, params = _PRIMARY_FORMATS[fmt]
+        ok, encoded = cv2.imencode(ext, frame, params)
         if not ok:
-            raise RuntimeError("PNG encoding failed")
-        return encoded.tobytes()
+            raise RuntimeError(f"{fmt.upper()} encoding failed")
+        return encoded.reshape(-1).data, content_type
 
     @staticmethod
-    def _encode_thumbnail(frame: np.ndarray) -> bytes:
+    def _encode_thumbnail(frame: np.ndarray) -> memoryview:
         h, w = frame.shape[:2]
         if w <= 0 or h <= 0:
             raise RuntimeError("Invalid frame dimensions")
@@ -228,14 +503,10 @@ class FrameUploader:
         else:
             resized = frame
 
-        ok, encoded = cv2.imencode(
-            ".jpg",
-            resized,
-            [cv2.IMWRITE_JPEG_QUALITY, int(FRAME_THUMB_JPEG_QUALITY)],
-        )
+        ok, encoded = cv2.imencode(".jpg", resized, _THUMB_PARAMS)
         if not ok:
             raise RuntimeError("Thumbnail encoding failed")
-        return encoded.tobytes()
+        return encoded.reshape(-1).data
 
     def _save_local_fallback(self, job: _FrameJob) -> None:
         if not self._local_fallback_enabled:
@@ -246,11 +517,11 @@ class FrameUploader:
             path = os.path.join(self._fallback_dir, f"upload_fallback_{epoch_ms}.png")
             ok = cv2.imwrite(path, job.frame)
             if ok:
-                print(
-                    f"[UPLOAD] Saved local fallback frame -> {path} "
-                    f"(brush={job.brush_mode}, shape={job.shape_mode})"
+                _log.info(
+                    "Saved local fallback frame -> %s (brush=%s, shape=%s)",
+                    path, job.brush_mode, job.shape_mode,
                 )
             else:
-                print("[UPLOAD] Local fallback save failed: cv2.imwrite returned False.")
+                _log.warning("Local fallback save failed: cv2.imwrite returned False.")
         except Exception as exc:
-            print(f"[UPLOAD] Local fallback save failed: {exc}")
+            _log.warning("Local fallback save failed: %s", exc)
@@ -0,0 +1,96 @@
+"""
+_text.py — 4.0
+--------------
+Shared text helpers for the HUD and onboarding screens.
+
+HUD strings repeat frame after frame, so each (text, font, scale, thick) is
+rasterised once into a Q8 coverage mask and later draws are a single integer
+blend of that mask into the frame, in any colour.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional
+
+import cv2
+import numpy as np
+
+
+@lru_cache(maxsize=256)
+def measure(text: str, font: int, scale: float, thick: int) -> tuple[tuple[int, int], int]:
+    """Memoised cv2.getTextSize: HUD strings repeat frame after frame."""
+    return cv2.getTextSize(text, font, scale, thick)
+
+
+def _q8(mask: np.ndarray) -> np.ndarray:
+    """uint8 coverage 0..255 -> uint16 Q8 coverage 0..256, shape (h, w, 1)."""
+    cov = mask[..., None].astype(np.uint16)
+    cov *= 257
+    cov += 128
+    cov >>= 8
+    return cov
+
+
+@lru_cache(maxsize=256)
+def _text_mask(text: str, font: int, scale: float, thick: int,
+               shadow: Optional[tuple[int, int, int]]):
+    """
+    Coverage of `text` as drawn by cv2.putText(..., LINE_AA), trimmed to its
+    ink. Returns (cov, inv, dx, dy): Q8 text coverage and the Q8 weight left
+    for the background, as (h, w, 1) uint16, plus the mask's top-left offset
+    from the text origin.
+
+    With `shadow=(sx, sy, sthick)` a black copy drawn at (+sx, +sy) first is
+    folded into `inv`, so text plus shadow is still a single blend:
+    out = roi*(1-a_shadow)*(1-a_text) + color*a_text.
+    """
+    (tw, th), base = measure(text, font, scale, thick)
+    sx, sy, sthick = shadow or (0, 0, 0)
+    pad = max(thick, sthick) + 2 + th // 2 + max(abs(sx), abs(sy))
+    shape = (th + base + 2*pad, tw + 2*pad)
+    mask = np.zeros(shape, dtype=np.uint8)
+    cv2.putText(mask, text, (pad, pad + th), font, scale, 255, thick, cv2.LINE_AA)
+    ink = mask
+    if shadow is not None:
+        smask = np.zeros(shape, dtype=np.uint8)
+        cv2.putText(smask, text, (pad + sx, pad + th + sy), font, scale, 255, sthick, cv2.LINE_AA)
+        ink = np.maximum(mask, smask)
+    rows = np.flatnonzero(ink.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(ink.any(axis=0))
+    r0, r1, c0, c1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+    cov = _q8(mask[r0:r1, c0:c1])
+    inv = 256 - cov
+    if shadow is not None:
+        both = inv.astype(np.uint32) * (256 - _q8(smask[r0:r1, c0:c1]))
+        inv = ((both + 128) >> 8).astype(np.uint16)
+    return cov, inv, int(c0) - pad, int(r0) - pad - th
+
+
+def draw_text(frame: np.ndarray, text: str, org: tuple[int, int],
+              font: int, scale: float, color, thick: int = 1,
+              shadow: Optional[tuple[int, int, int]] = None) -> None:
+    """
+    Drop-in for cv2.putText(frame, text, org, font, scale, color, thick, LINE_AA).
+    `shadow=(dx, dy, thick)` also lays a black copy underneath, in the same pass.
+    """
+    entry = _text_mask(text, font, scale, thick, shadow)
+    if entry is None:
+        return
+    cov, inv, dx, dy = entry
+    h, w = cov.shape[:2]
+    x0, y0 = org[0] + dx, org[1] + dy
+    fh, fw = frame.shape[:2]
+    cx0, cy0 = max(0, -x0), max(0, -y0)
+    cx1, cy1 = min(w, fw - x0), min(h, fh - y0)
+    if cx0 >= cx1 or cy0 >= cy1:
+        return
+    roi = frame[y0+cy0:y0+cy1, x0+cx0:x0+cx1]
+    out = roi * inv[cy0:cy1, cx0:cx1]
+    if any(color[:3]):
+        out += cov[cy0:cy1, cx0:cx1] * np.array(color[:3], dtype=np.uint16)
+    out += 128
+    out >>= 8
+    roi[:] = out
@@ -11,7 +11,6 @@ Futuristic floating glassmorphism toolbar with:
 
 from __future__ import annotations
 
-import math
 import time
 from dataclasses import dataclass, field
 from typing import Optional
@@ -37,6 +36,12 @@ _TEXT_IDLE  = (120, 118, 140)
 _TEXT_ACT   = (14, 12, 20)
 _SWATCH_R   = 8
 _DIVIDER    = (40, 38, 55)
+# UI_ACCENT tinted by hover (0.35→1.0) / pulse (0.5→1.0), indexed by int(t*100)
+_GLOW_LUT   = tuple(tuple(min(255, int(c * (0.35 + 0.65 * i / 100))) for c in UI_ACCENT)
+                    for i in range(101))
+_PULSE_LUT  = tuple(tuple(min(255, int(c * (0.5 + 0.5 * i / 100))) for c in UI_ACCENT)
+                    for i in range(101))
+_BTN_HALF   = max(BTN_W, BTN_H) // 2 + 8   # dirty half-width: arc, ring and dot fit
 
 
 @dataclass
@@ -48,23 +53,25 @@ class _Btn:
     _hover_start: float = field(default=0.0, repr=False)
     _pulse:       float = field(default=0.0, repr=False)
 
-    def hover_progress(self) -> float:
+    # Times are time.monotonic() values, read once per frame by the toolbar.
+
+    def hover_progress(self, now: float) -> float:
         if self._hover_start == 0.0:
             return 0.0
-        return min(1.0, (time.time() - self._hover_start) / HOVER_ACTIVATE_SEC)
+        return min(1.0, (now - self._hover_start) / HOVER_ACTIVATE_SEC)
 
-    def start_hover(self) -> None:
+    def start_hover(self, now: float) -> None:
         if self._hover_start == 0.0:
-            self._hover_start = time.time()
+            self._hover_start = now
 
     def end_hover(self) -> None:
         self._hover_start = 0.0
 
-    def trigger_pulse(self) -> None:
-        self._pulse = time.time()
+    def trigger_pulse(self, now: float) -> None:
+        self._pulse = now
 
-    def pulse_alpha(self) -> float:
-        age = time.time() - self._pulse
+    def pulse_alpha(self, now: float) -> float:
+        age = now - self._pulse
         if age > 0.5:
             return 0.0
         return max(0.0, 1.0 - age / 0.5)
@@ -117,6 +124,19 @@ class AnimatedToolbar:
         ("LDS", "load_slides"),
     ]
 
+    # (cos, sin) per whole degree, starting at 12 o'clock, for _draw_arc.
+    _UNIT_CIRCLE = np.stack([
+        np.cos(np.radians(np.arange(361) - 90)),
+        np.sin(np.radians(np.arange(361) - 90)),
+    ], axis=1).astype(np.float32)
+
+    # Slide-in: ease-out cubic sampled at 64 steps over 0.5 s, stored
+    # directly as the bar's vertical offset.
+    _SLIDE_IN_SEC = 0.5
+    _SLIDE_OFFSETS = tuple(
+        int((1 - t) ** 3 * -(TOOLBAR_H + 4)) for t in (i / 63 for i in range(64))
+    )
+
     _ICON_FONT = cv2.FONT_HERSHEY_SIMPLEX
     _ICON_SCALE = 0.34
     _ICON_THICKNESS = 1
@@ -127,10 +147,26 @@ class AnimatedToolbar:
         self._slide_btns: list[_Btn] = []
         self._slider_rect = (0, 0, 0, 0)
         self._slide_in    = 0.0          # animation progress 0→1
-        self._slide_in_start = time.time()
+        self._slide_in_start = time.monotonic()
         self._last_hovered: Optional[str] = None
-        self._bar_tint = np.full((TOOLBAR_H, self._fw, 3), (12, 12, 18), dtype=np.uint8)
-        self._icon_size_cache: dict[str, tuple[int, int]] = {}
+        self._hovered: Optional[_Btn] = None
+        # Constant half of the bar blend, tint * _BG_ALPHA, built once so the
+        # per-frame background is a single scaleAdd pass over the ROI.
+        self._bar_tint = np.full(
+            (TOOLBAR_H, self._fw, 3),
+            np.round(np.array((12, 12, 18)) * _BG_ALPHA),
+            dtype=np.uint8,
+        )
+        self._icon_offset: dict[str, tuple[int, int]] = {}   # icon -> (tw//2, th//2)
+        # Static bar layer in Q8: out = (frame * inv + premul) >> 8 over rows
+        # 0..TOOLBAR_H. _layer_key is (slide_mode, thickness, button states).
+        self._layer_inv    = np.zeros((TOOLBAR_H+1, self._fw, 3), dtype=np.uint16)
+        self._layer_premul = np.zeros((TOOLBAR_H+1, self._fw, 3), dtype=np.uint16)
+        self._layer_key: Optional[tuple] = None
+        # Paint targets for _refresh_layer, reset per dirty span
+        self._on_black = np.zeros((TOOLBAR_H+1, self._fw, 3), dtype=np.uint8)
+        self._on_white = np.zeros((TOOLBAR_H+1, self._fw, 3), dtype=np.uint8)
+        self._slide_scratch = np.empty((TOOLBAR_H+1, self._fw, 3), dtype=np.uint8)
         self._build()
 
     # ── Layout ────────────────────────────────────────────────────────────────
@@ -164,6 +200,17 @@ class AnimatedToolbar:
             self._slide_btns.append(_Btn(icon, action, None, (x2, y1, x2+BTN_W, y2)))
             x2 += BTN_W + 4
 
+        # (N, 4) rect tables for vectorised hit-testing in update_hover().
+        self._draw_rects  = np.array([b.rect for b in self._draw_btns], dtype=np.int32)
+        self._slide_rects = np.array([b.rect for b in self._slide_btns], dtype=np.int32)
+
+        # Icon set is static: measure every label once.
+        for icon, _ in self._DRAW_TOOLS + self._SLIDE_TOOLS:
+            (tw, th), _ = cv2.getTextSize(
+                icon, self._ICON_FONT, self._ICON_SCALE, self._ICON_THICKNESS,
+            )
+            self._icon_offset[icon] = (tw // 2, th // 2)
+
     # ── Hover update ──────────────────────────────────────────────────────────
 
     def update_hover(self, fingertip: Optional[tuple], slide_mode: bool = False) -> Optional[str]:
@@ -172,33 +219,39 @@ class AnimatedToolbar:
         Returns action string when a button activates (dwell completed).
         """
         if fingertip is None:
-            for btn in self._all_btns(slide_mode):
-                btn.end_hover()
+            self._set_hovered(None)
             self._last_hovered = None
             return None
 
         fx, fy = fingertip
         if fy > TOOLBAR_H:
-            for btn in self._all_btns(slide_mode):
-                btn.end_hover()
+            self._set_hovered(None)
             return None
 
-        activated = None
-        for btn in self._all_btns(slide_mode):
-            x1,y1,x2,y2 = btn.rect
-            hit = x1 <= fx <= x2 and y1 <= fy <= y2
-            if hit:
-                btn.start_hover()
-                if btn.hover_progress() >= 1.0 and self._last_hovered != btn.action:
-                    btn.trigger_pulse()
-                    activated = btn.action
-                    self._last_hovered = btn.action
-            else:
-                btn.end_hover()
-                if self._last_hovered == btn.action:
-                    self._last_hovered = None
+        # Buttons never overlap, so at most one rect is hit.
+        rects = self._slide_rects if slide_mode else self._draw_rects
+        hits  = ((rects[:, 0] <= fx) & (fx <= rects[:, 2])
+                 & (rects[:, 1] <= fy) & (fy <= rects[:, 3]))
+        btn = self._all_btns(slide_mode)[int(hits.argmax())] if hits.any() else None
+        self._set_hovered(btn)
+        if btn is None or btn.action != self._last_hovered:
+            self._last_hovered = None
+        if btn is None:
+            return None
+
+        now = time.monotonic()
+        btn.start_hover(now)
+        if btn.hover_progress(now) >= 1.0 and self._last_hovered != btn.action:
+            btn.trigger_pulse(now)
+            self._last_hovered = btn.action
+            return btn.action
+        return None
 
-        return activated
+    def _set_hovered(self, btn: Optional[_Btn]) -> None:
+        """Only the previously hovered button needs its dwell timer reset."""
+        if self._hovered is not None and self._hovered is not btn:
+            self._hovered.end_hover()
+        self._hovered = btn
 
     def check_hit(self, fingertip: Optional[tuple], slide_mode: bool = False) -> Optional[str]:
         """Instant hit test (no dwell) — for backward compat / keyboard bypass."""
@@ -231,58 +284,132 @@ class AnimatedToolbar:
         slide_mode:    bool = False,
     ) -> np.ndarray:
         # Slide-in animation
-        age = time.time() - self._slide_in_start
-        self._slide_in = min(1.0, age / 0.5)
-        offset_y = int((1.0 - self._ease(self._slide_in)) * -(TOOLBAR_H + 4))
+        now = time.monotonic()
+        offset_y = 0
+        if self._slide_in < 1.0:
+            self._slide_in = min(1.0, (now - self._slide_in_start) / self._SLIDE_IN_SEC)
+            offset_y = self._SLIDE_OFFSETS[int(self._slide_in * 63)]
 
         if offset_y < 0:
-            # Still animating — draw to temp surface and blit
-            temp = frame.copy()
-            self._render_bar(temp, active_action, active_color, thickness, slide_mode)
-            roi = temp[0:TOOLBAR_H+offset_y, :]
-            frame[0:TOOLBAR_H+offset_y, :] = roi
+            # Still animating — draw into the bar-sized scratch, blit the visible rows
+            temp = self._slide_scratch
+            np.copyto(temp, frame[0:TOOLBAR_H+1, 0:self._fw])
+            self._render_bar(temp, active_action, active_color, thickness, slide_mode, now)
+            np.copyto(frame[0:TOOLBAR_H+offset_y, 0:self._fw], temp[0:TOOLBAR_H+offset_y])
         else:
-            self._render_bar(frame, active_action, active_color, thickness, slide_mode)
+            self._render_bar(frame, active_action, active_color, thickness, slide_mode, now)
 
         return frame
 
-    def _render_bar(self, frame, active_action, active_color, thickness, slide_mode):
+    def _render_bar(self, frame, active_action, active_color, thickness, slide_mode, now):
+        # Settled buttons are baked into the static layer; only buttons that
+        # are mid-dwell or pulsing get drawn per frame, on top of it.
+        btns = self._slide_btns if slide_mode else self._draw_btns
+        states:    list[Optional[tuple]] = []
+        animating: list[tuple] = []
+        for btn in btns:
+            is_active = (btn.action == active_action)
+            hov       = btn.hover_progress(now)
+            pulse     = btn.pulse_alpha(now)
+            if pulse > 0 or 0.0 < hov < 1.0:
+                states.append(None)
+                animating.append((btn, is_active, hov, pulse))
+            else:
+                states.append((is_active, hov))
+        self._refresh_layer(slide_mode, thickness, btns, states)
+
+        # Bar tint, chrome, slider and settled buttons in one Q8 pass
+        roi = frame[0:TOOLBAR_H+1, 0:self._fw]
+        out = roi * self._layer_inv
+        out += self._layer_premul
+        out >>= 8
+        roi[:] = out
+
+        for btn, is_active, hov, pulse in animating:
+            self._paint_btn(frame, btn.rect, btn, is_active, hov, pulse)
+
+    def _refresh_layer(self, slide_mode, thickness, btns, states) -> None:
+        """
+        Re-rasterise only the dirty columns of the static bar layer: those
+        under buttons whose state changed, or the slider when the thickness
+        did. A mode switch repaints the whole strip. Only elements that reach
+        into the dirty span are painted.
+        """
+        key = self._layer_key
+        fw  = self._fw
+        if key is None or key[0] != slide_mode:
+            spans = [(0, fw)]
+        else:
+            spans = []
+            if key[1] != thickness and not slide_mode:
+                sx1,_,sx2,_ = self._slider_rect
+                spans.append((sx1 - 12, sx2 + 12))
+            for btn, old, new in zip(btns, key[2], states):
+                if old != new:
+                    cx = (btn.rect[0] + btn.rect[2]) // 2
+                    spans.append((cx - _BTN_HALF, cx + _BTN_HALF + 1))
+        self._layer_key = (slide_mode, thickness, states)
+        if not spans:
+            return
+        x0 = max(0, min(a for a, _ in spans))
+        x1 = min(fw, max(b for _, b in spans))
+
+        # Paint over black and over white: the difference is per-pixel
+        # coverage, so the layer composites like drawing in place (AA too).
+        on_black, on_white = self._on_black, self._on_white
+        on_black[:, x0:x1] = 0
+        on_white[:, x0:x1] = 255
+        for canvas in (on_black, on_white):
+            self._paint_static(canvas, slide_mode, thickness, btns, states, x0, x1)
+        black = on_black[:, x0:x1]
+        inv = np.round((on_white[:, x0:x1].astype(np.float32) - black) * (256.0 / 255.0))
+        self._layer_inv[:, x0:x1] = inv
+        premul = self._layer_premul[:, x0:x1]
+        np.left_shift(black, 8, out=premul, dtype=np.uint16)
+        premul += 128
+
+    def _paint_static(self, canvas, slide_mode, thickness, btns, states, x0, x1) -> None:
+        """Paint the static bar into columns x0:x1 of `canvas`; pixels outside are don't-care."""
         fw = self._fw
 
+        def reaches(a, b):
+            return a < x1 and b > x0
+
         # Background
-        bar_roi = frame[0:TOOLBAR_H, 0:fw]
-        cv2.addWeighted(self._bar_tint, _BG_ALPHA, bar_roi, 1-_BG_ALPHA, 0, bar_roi)
+        bar_roi = canvas[0:TOOLBAR_H, x0:x1]
+        cv2.scaleAdd(bar_roi, 1-_BG_ALPHA, self._bar_tint[:, x0:x1], dst=bar_roi)
 
         # Bottom border line (thin, glowing)
-        cv2.line(frame,(0,TOOLBAR_H),(fw,TOOLBAR_H), UI_ACCENT, 1)
+        cv2.line(canvas,(x0,TOOLBAR_H),(x1,TOOLBAR_H), UI_ACCENT, 1)
 
         # Dividers
         cy = TOOLBAR_H//2
         sx1,_,sx2,_ = self._slider_rect
         for dv in [sx1-8, sx2+8]:
-            cv2.line(frame,(dv,cy-16),(dv,cy+16),_DIVIDER,1)
+            if reaches(dv, dv+1):
+                cv2.line(canvas,(dv,cy-16),(dv,cy+16),_DIVIDER,1)
 
         # Slider (only in draw mode)
-        if not slide_mode:
-            self._render_slider(frame, thickness)
+        if not slide_mode and reaches(sx1-12, sx2+12):
+            self._render_slider(canvas, thickness)
 
-        # Buttons
-        btns = self._slide_btns if slide_mode else self._draw_btns
-        for btn in btns:
-            self._render_btn(frame, btn, active_action)
+        # Settled buttons
+        for btn, state in zip(btns, states):
+            cx = (btn.rect[0] + btn.rect[2]) // 2
+            if state is not None and reaches(cx - _BTN_HALF, cx + _BTN_HALF + 1):
+                self._paint_btn(canvas, btn.rect, btn, state[0], state[1], 0.0)
 
         # Mode badge
-        mode_txt = "SLIDES" if slide_mode else "DRAW"
-        cv2.putText(frame, mode_txt,
-                    (fw-72, TOOLBAR_H-8),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.38, UI_MUTED, 1, cv2.LINE_AA)
-
-    def _render_btn(self, frame, btn: _Btn, active: str) -> None:
-        x1,y1,x2,y2 = btn.rect
-        is_active = (btn.action == active)
+        if reaches(fw-72, fw):
+            mode_txt = "SLIDES" if slide_mode else "DRAW"
+            cv2.putText(canvas, mode_txt,
+                        (fw-72, TOOLBAR_H-8),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.38, UI_MUTED, 1, cv2.LINE_AA)
+
+    def _paint_btn(self, frame, rect: tuple, btn: _Btn, is_active: bool,
+                   hov: float, pulse: float) -> None:
+        x1,y1,x2,y2 = rect
         cx,cy     = (x1+x2)//2, (y1+y2)//2
-        hov       = btn.hover_progress()
-        pulse     = btn.pulse_alpha()
 
         # ── Colour swatch ──
         if btn.color is not None:
@@ -294,7 +421,7 @@ class AnimatedToolbar:
             # Hover ring
             if hov > 0:
                 ring_r = r + 4
-                ring_col = tuple(min(255, int(c * (0.35 + 0.65 * hov))) for c in UI_ACCENT)
+                ring_col = _GLOW_LUT[int(hov * 100)]
                 cv2.circle(frame, (cx, cy), ring_r, ring_col, 1, cv2.LINE_AA)
 
             # Active underline dot
@@ -313,32 +440,28 @@ class AnimatedToolbar:
         if btn.action in ("clear","clear_annotation") and not is_active:
             txt = UI_DANGER
 
-        # Pill background
-        rr = 6
-        for rect in [
-            (x1+rr,y1,x2-rr,y2),(x1,y1+rr,x2,y2-rr)
-        ]:
-            cv2.rectangle(frame,rect[:2],rect[2:],bg,cv2.FILLED)
-        for corner in [(x1+rr,y1+rr),(x2-rr,y1+rr),(x1+rr,y2-rr),(x2-rr,y2-rr)]:
-            cv2.circle(frame,corner,rr,bg,cv2.FILLED)
+        # Pill background (one masked write; the mask is non-AA, so exact)
+        roi  = frame[y1:y2+1, x1:x2+1]
+        mask = self._pill_mask(x2-x1, y2-y1)
+        roi[mask[:roi.shape[0], :roi.shape[1]]] = bg
 
         # Hover glow outline
         if hov > 0.05 and not is_active:
-            glow_col = tuple(min(255, int(c * (0.35 + 0.65 * hov))) for c in UI_ACCENT)
+            glow_col = _GLOW_LUT[int(hov * 100)]
             cv2.rectangle(frame, (x1+1, y1+1), (x2-1, y2-1), glow_col, 1, cv2.LINE_AA)
 
         # Pulse ring
         if pulse > 0:
             exp = int((1-pulse)*20)
-            pulse_col = tuple(min(255, int(c * (0.5 + 0.5 * pulse))) for c in UI_ACCENT)
+            pulse_col = _PULSE_LUT[int(pulse * 100)]
             cv2.rectangle(frame, (x1-exp, y1-exp), (x2+exp, y2+exp), pulse_col, 1, cv2.LINE_AA)
 
         # Icon
-        tw, th = self._icon_metrics(btn.icon)
+        off_x, off_y = self._icon_offset[btn.icon]
         cv2.putText(
             frame,
             btn.icon,
-            (cx - tw // 2, cy + th // 2),
+            (cx - off_x, cy + off_y),
             self._ICON_FONT,
             self._ICON_SCALE,
             txt,
@@ -370,37 +493,31 @@ class AnimatedToolbar:
 
     def _draw_arc(self, frame, cx, cy, r, progress, color):
         """Draw a progress arc around a button (0–1)."""
-        start = -90
-        end   = start + int(progress * 360)
-        pts   = []
         steps = max(2, int(progress * 36))
-        for i in range(steps+1):
-            angle = math.radians(start + (end-start)*i/steps)
-            pts.append((int(cx+r*math.cos(angle)), int(cy+r*math.sin(angle))))
-        for i in range(len(pts)-1):
-            cv2.line(frame, pts[i], pts[i+1], color, 1, cv2.LINE_AA)
+        idx   = np.linspace(0, int(progress * 360), steps + 1).astype(np.intp)
+        pts   = self._UNIT_CIRCLE[idx] * r
+        pts  += (cx, cy)
+        cv2.polylines(frame, [pts.astype(np.int32)], False, color, 1, cv2.LINE_AA)
+
+    _pill_masks: dict[tuple[int, int], np.ndarray] = {}
+
+    @classmethod
+    def _pill_mask(cls, w: int, h: int) -> np.ndarray:
+        """Boolean (h+1, w+1) rounded-rect mask, rasterised once per size."""
+        mask = cls._pill_masks.get((w, h))
+        if mask is None:
+            m  = np.zeros((h+1, w+1), dtype=np.uint8)
+            rr = 6
+            cv2.rectangle(m, (rr, 0), (w-rr, h), 1, cv2.FILLED)
+            cv2.rectangle(m, (0, rr), (w, h-rr), 1, cv2.FILLED)
+            for corner in [(rr, rr), (w-rr, rr), (rr, h-rr), (w-rr, h-rr)]:
+                cv2.circle(m, corner, rr, 1, cv2.FILLED)
+            mask = cls._pill_masks[(w, h)] = m.astype(bool)
+        return mask
 
     def _all_btns(self, slide_mode: bool) -> list[_Btn]:
         return self._slide_btns if slide_mode else self._draw_btns
 
-    def _icon_metrics(self, icon: str) -> tuple[int, int]:
-        metrics = self._icon_size_cache.get(icon)
-        if metrics is None:
-            (tw, th), _ = cv2.getTextSize(
-                icon,
-                self._ICON_FONT,
-                self._ICON_SCALE,
-                self._ICON_THICKNESS,
-            )
-            metrics = (tw, th)
-            self._icon_size_cache[icon] = metrics
-        return metrics
-
-    @staticmethod
-    def _ease(t: float) -> float:
-        """Ease-out cubic."""
-        return 1 - (1-t)**3
-
     @property
     def height(self) -> int:
         return TOOLBAR_H
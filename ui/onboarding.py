@@ -12,27 +12,42 @@ import time
 import cv2
 import numpy as np
 
+from ui._text import draw_text as _draw_text, measure as _measure
+from ui.overlays import darken
 from utils.config import (
     DISPLAY_WIDTH, DISPLAY_HEIGHT,
     UI_ACCENT, UI_ACCENT2, UI_TEXT, UI_MUTED, UI_PANEL, UI_HIGHLIGHT,
     COL_GREEN, COL_RED, COL_BLUE, COL_BLACK,
 )
 
+# Gesture reference panel: fixed size, centred on the fixed display
+_REF_W, _REF_H = 660, 460
+_REF_X, _REF_Y = (DISPLAY_WIDTH-_REF_W)//2, (DISPLAY_HEIGHT-_REF_H)//2
+_REF_PROMPT_Y  = _REF_Y + _REF_H - 18
+
+
+_GLASS_TINTS: dict[tuple, np.ndarray] = {}
+
 
 def _glass(frame, x1,y1,x2,y2, alpha=0.82, fill=(18,18,26), border=None):
-    ov = frame.copy()
-    cv2.rectangle(ov,(x1,y1),(x2,y2),fill,cv2.FILLED)
-    cv2.addWeighted(ov,alpha,frame,1-alpha,0,frame)
+    # Blend only the panel ROI (corners inclusive, like cv2.rectangle); the
+    # constant fill*alpha half is cached per panel size.
+    roi = frame[y1:y2+1, x1:x2+1]
+    key = (roi.shape, fill, alpha)
+    tint = _GLASS_TINTS.get(key)
+    if tint is None:
+        tint = np.full(roi.shape, np.round(np.array(fill) * alpha), dtype=np.uint8)
+        _GLASS_TINTS[key] = tint
+    cv2.scaleAdd(roi, 1-alpha, tint, dst=roi)
     cv2.rectangle(frame,(x1,y1),(x2,y2),border or UI_ACCENT,1)
 
 
-def _center(frame, text, y, scale=0.7, color=None, thick=1):
+def _center(frame, text, y, scale=0.7, color=None, thick=1, width=DISPLAY_WIDTH):
     color = color or UI_TEXT
     font  = cv2.FONT_HERSHEY_SIMPLEX
-    (tw,_),_ = cv2.getTextSize(text,font,scale,thick)
-    x = (DISPLAY_WIDTH-tw)//2
-    cv2.putText(frame,text,(x+1,y+1),font,scale,(0,0,0),thick+1,cv2.LINE_AA)
-    cv2.putText(frame,text,(x,  y  ),font,scale,color,  thick,  cv2.LINE_AA)
+    (tw,_),_ = _measure(text,font,scale,thick)
+    x = (width-tw)//2
+    _draw_text(frame,text,(x,y),font,scale,color,thick,shadow=(1,1,thick+1))
 
 
 class OnboardingScreen:
@@ -52,20 +67,27 @@ class OnboardingScreen:
         ("Palm hold",   "Laser pointer (slide mode)",  (0,60,255)),
     ]
 
+    # Column-wise row layout for the reference panel, panel-local coords
+    _ROW_NAME  = tuple(g for g,_,_ in GESTURES)
+    _ROW_DESC  = tuple(f"→  {d}" for _,d,_ in GESTURES)
+    _ROW_COLOR = tuple(c for _,_,c in GESTURES)
+    _ROW_Y     = tuple(68+i*32 for i in range(len(GESTURES)))
+
     def __init__(self):
         self._screen = 0
         self._name   = ""
         self._done   = False
         self._fade   = 0.0
+        # Q8 (inv, premul) pair for the static reference panel, built once
+        self._ref_sprite: tuple[np.ndarray, np.ndarray] | None = None
 
     def update(self, frame: np.ndarray, key: int):
         if self._done:
             return True, self._name
         self._fade = min(1.0, self._fade+0.05)
 
-        # Dark base
-        dark = np.zeros_like(frame)
-        cv2.addWeighted(dark,0.60,frame,0.40,0,frame)
+        # Dark base: 40% brightness, scaled in place
+        darken(frame, 0.40)
 
         if self._screen == 0:
             self._draw_ref(frame)
@@ -77,24 +99,44 @@ class OnboardingScreen:
         return False, ""
 
     def _draw_ref(self, frame):
-        W,H = DISPLAY_WIDTH,DISPLAY_HEIGHT
-        pw,ph = 660,460
-        px,py = (W-pw)//2, (H-ph)//2
-        _glass(frame,px,py,px+pw,py+ph)
-
-        _center(frame,"✋  AirCanvas 4.0  —  Gesture Reference",
-                py+38, scale=0.75, color=UI_ACCENT, thick=1)
-        cv2.line(frame,(px+20,py+52),(px+pw-20,py+52),(40,38,55),1)
-
-        rh = 32
-        for i,(gesture,desc,col) in enumerate(self.GESTURES):
-            ry = py+68+i*rh
-            cv2.putText(frame, gesture,(px+22,ry),cv2.FONT_HERSHEY_SIMPLEX,0.44,col,1,cv2.LINE_AA)
-            cv2.putText(frame, f"→  {desc}",(px+200,ry),cv2.FONT_HERSHEY_SIMPLEX,0.42,UI_TEXT,1,cv2.LINE_AA)
+        # Glass, header and gesture rows are static: one Q8 blend per frame
+        if self._ref_sprite is None:
+            self._ref_sprite = self._build_ref_sprite()
+        inv, premul = self._ref_sprite
+        roi = frame[_REF_Y:_REF_Y+_REF_H+1, _REF_X:_REF_X+_REF_W+1]
+        out = roi * inv
+        out += premul
+        out >>= 8
+        roi[:] = out
 
         pulse = int(160+80*abs(np.sin(time.time()*2.5)))
         _center(frame,"Press  SPACE  to continue",
-                py+ph-18,scale=0.46,color=(pulse,pulse,pulse))
+                _REF_PROMPT_Y,scale=0.46,color=(pulse,pulse,pulse))
+
+    def _build_ref_sprite(self) -> tuple[np.ndarray, np.ndarray]:
+        # Paint over black and over white: the difference is per-pixel
+        # coverage, so the blend matches drawing in place (AA text too).
+        pw,ph = _REF_W,_REF_H
+        on_black = np.zeros((ph+1, pw+1, 3), dtype=np.uint8)
+        on_white = np.full((ph+1, pw+1, 3), 255, dtype=np.uint8)
+        for canvas in (on_black, on_white):
+            self._paint_ref(canvas)
+        inv = np.round((on_white.astype(np.float32) - on_black) * (256.0 / 255.0))
+        premul = np.left_shift(on_black, 8, dtype=np.uint16)
+        premul += 128
+        return inv.astype(np.uint16), premul
+
+    def _paint_ref(self, canvas):
+        pw,ph = _REF_W,_REF_H
+        _glass(canvas,0,0,pw,ph)
+
+        _center(canvas,"✋  AirCanvas 4.0  —  Gesture Reference",
+                38, scale=0.75, color=UI_ACCENT, thick=1, width=pw)
+        cv2.line(canvas,(20,52),(pw-20,52),(40,38,55),1)
+
+        for name,desc,col,ry in zip(self._ROW_NAME,self._ROW_DESC,self._ROW_COLOR,self._ROW_Y):
+            cv2.putText(canvas, name,(22,ry),cv2.FONT_HERSHEY_SIMPLEX,0.44,col,1,cv2.LINE_AA)
+            cv2.putText(canvas, desc,(200,ry),cv2.FONT_HERSHEY_SIMPLEX,0.42,UI_TEXT,1,cv2.LINE_AA)
 
     def _draw_name(self, frame, key: int):
         if key==13:
@@ -116,6 +158,6 @@ class OnboardingScreen:
         cv2.rectangle(frame,(bx1,by1),(bx2,by2),(22,22,30),cv2.FILLED)
         cv2.rectangle(frame,(bx1,by1),(bx2,by2),UI_ACCENT,1)
         cursor = "|" if int(time.time()*2)%2==0 else " "
-        cv2.putText(frame,self._name+cursor,(bx1+10,by2-14),
-                    cv2.FONT_HERSHEY_SIMPLEX,0.62,UI_TEXT,1,cv2.LINE_AA)
+        _draw_text(frame,self._name+cursor,(bx1+10,by2-14),
+                   cv2.FONT_HERSHEY_SIMPLEX,0.62,UI_TEXT,1)
         _center(frame,"Press  ENTER  to start",py+ph-18,scale=0.44,color=UI_MUTED)
@@ -19,6 +19,7 @@ import cv2
 import numpy as np
 from typing import Optional
 
+from ui._text import draw_text as _draw_text, measure as _measure
 from utils.config import (
     UI_ACCENT, UI_ACCENT2, UI_HIGHLIGHT, UI_TEXT, UI_PANEL, UI_MUTED,
     UI_DANGER, TOOLBAR_H,
@@ -28,9 +29,28 @@ from utils.config import (
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 def _shadow_text(frame, text, pos, font, scale, color, thick=1):
-    x, y = pos
-    cv2.putText(frame, text, (x+1,y+1), font, scale, (0,0,0), thick+1, cv2.LINE_AA)
-    cv2.putText(frame, text, (x,  y  ), font, scale, color,   thick,   cv2.LINE_AA)
+    _draw_text(frame, text, pos, font, scale, color, thick, shadow=(1, 1, thick+1))
+
+
+_DARKEN_LUTS: dict[int, np.ndarray] = {}
+
+
+def darken(frame: np.ndarray, factor: float) -> np.ndarray:
+    """Scale `frame` toward black in place via a cached Q8 lookup table."""
+    k = min(256, max(0, int(factor*256 + 0.5)))
+    lut = _DARKEN_LUTS.get(k)
+    if lut is None:
+        lut = ((np.arange(256, dtype=np.uint32)*k + 128) >> 8).astype(np.uint8)
+        _DARKEN_LUTS[k] = lut
+    return cv2.LUT(frame, lut, dst=frame)
+
+
+# CursorGlow pulse radius, 16 + 5|sin(6t)|, sampled at 64 phases per 2π
+_CURSOR_PULSE_R    = tuple(16 + int(5*abs(math.sin(2*math.pi*i/64))) for i in range(64))
+_CURSOR_PULSE_RATE = 6 * 64 / (2*math.pi)
+
+# GestureHint text colour at 32 fade steps
+_HINT_FADE_LUT = tuple(tuple(int(c*i/31) for c in UI_HIGHLIGHT) for i in range(32))
 
 
 # ── Components ────────────────────────────────────────────────────────────────
@@ -50,17 +70,18 @@ class FadeTransition:
     @property
     def active(self): return self._active
 
-    def apply(self, frame: np.ndarray) -> np.ndarray:
+    def apply(self, frame: np.ndarray, now: Optional[float] = None) -> np.ndarray:
         if not self._active: return frame
-        t = (time.time()-self._start)/self._dur
+        if now is None: now = time.time()
+        t = (now-self._start)/self._dur
         if self._out:
             alpha = min(t,1.0)
-            if t>=1.0: self._out=False; self._start=time.time()
+            if t>=1.0: self._out=False; self._start=now
         else:
             alpha = max(1.0-t,0.0)
             if t>=1.0: self._active=False
-        dark = np.zeros_like(frame)
-        return cv2.addWeighted(dark, alpha, frame, 1-alpha, 0)
+        # Blending toward black is just a scale; do it in place, no zeros buffer
+        return darken(frame, 1.0-alpha)
 
 
 class StatusToast:
@@ -72,11 +93,12 @@ class StatusToast:
         self._msg   = msg
         self._until = time.time() + duration
 
-    def draw(self, frame: np.ndarray):
-        if time.time() > self._until or not self._msg: return
+    def draw(self, frame: np.ndarray, now: Optional[float] = None):
+        if now is None: now = time.time()
+        if now > self._until or not self._msg: return
         h,w = frame.shape[:2]
         font,scale,thick = cv2.FONT_HERSHEY_SIMPLEX, 0.60, 1
-        (tw,th),_ = cv2.getTextSize(self._msg,font,scale,thick)
+        (tw,th),_ = _measure(self._msg,font,scale,thick)
         x = (w-tw)//2; y = h-22
         cv2.rectangle(frame,(x-10,y-th-6),(x+tw+10,y+7),(16,16,24),cv2.FILLED)
         cv2.rectangle(frame,(x-10,y-th-6),(x+tw+10,y+7),UI_ACCENT,1)
@@ -92,19 +114,20 @@ class GestureHint:
         self._text  = text
         self._until = time.time() + dur
 
-    def draw(self, frame: np.ndarray):
-        if not self._text or time.time()>self._until: return
+    def draw(self, frame: np.ndarray, now: Optional[float] = None):
+        if now is None: now = time.time()
+        if not self._text or now>self._until: return
         h,w = frame.shape[:2]
         font,scale = cv2.FONT_HERSHEY_SIMPLEX,0.70
-        (tw,th),_  = cv2.getTextSize(self._text,font,scale,2)
+        (tw,th),_  = _measure(self._text,font,scale,2)
         x = (w-tw)//2; y = TOOLBAR_H+46
-        alpha = max(0.0, 1.0-(time.time()-(self._until-1.0))/1.0)
-        col = tuple(int(c*alpha) for c in UI_HIGHLIGHT)
+        alpha = max(0.0, 1.0-(now-(self._until-1.0))/1.0)
+        col = _HINT_FADE_LUT[min(31, int(alpha*31))]
         _shadow_text(frame,self._text,(x,y),font,scale,col,2)
 
 
 class CursorGlow:
-    def draw(self, frame, pt, color, drawing: bool, eraser: bool):
+    def draw(self, frame, pt, color, drawing: bool, eraser: bool, now: Optional[float] = None):
         if pt is None: return
         x,y    = pt
         r_col  = (60,80,200) if eraser else color[:3]
@@ -112,10 +135,11 @@ class CursorGlow:
         r_in   = 5  if drawing else 3
 
         if drawing:
-            # Animated outer pulse
-            t     = time.time()
-            pulse = int(r_out + 5*abs(math.sin(t*6)))
-            cv2.circle(frame, (x, y), pulse, r_col, 1, cv2.LINE_AA)
+            # Animated outer pulse; at the trough it sits on the outer ring
+            if now is None: now = time.time()
+            pulse = _CURSOR_PULSE_R[int(now*_CURSOR_PULSE_RATE) & 63]
+            if pulse != r_out:
+                cv2.circle(frame, (x, y), pulse, r_col, 1, cv2.LINE_AA)
 
         cv2.circle(frame,(x,y),r_out,r_col,1,cv2.LINE_AA)
         cv2.circle(frame,(x,y),r_in, r_col,cv2.FILLED,cv2.LINE_AA)
@@ -130,7 +154,7 @@ class VoiceHUD:
         self._cmd_text  = f"MIC {text}"
         self._cmd_until = time.time() + dur
 
-    def draw(self, frame, voice_active: bool, depth_blocked: bool):
+    def draw(self, frame, voice_active: bool, depth_blocked: bool, now: Optional[float] = None):
         h,w = frame.shape[:2]
 
         # Mic badge (top-right)
@@ -138,23 +162,24 @@ class VoiceHUD:
         txt = "MIC ON" if voice_active else "MIC OFF"
         cv2.rectangle(frame,(w-78,8),(w-4,26),(14,14,20),cv2.FILLED)
         cv2.rectangle(frame,(w-78,8),(w-4,26),col,1)
-        cv2.putText(frame,txt,(w-74,21),cv2.FONT_HERSHEY_SIMPLEX,0.38,col,1,cv2.LINE_AA)
+        _draw_text(frame,txt,(w-74,21),cv2.FONT_HERSHEY_SIMPLEX,0.38,col,1)
 
         # Depth blocked
         if depth_blocked:
             txt2 = "DEPTH STOP"
-            (tw,_),_ = cv2.getTextSize(txt2,cv2.FONT_HERSHEY_SIMPLEX,0.50,1)
-            cv2.putText(frame,txt2,(w-tw-8,44),
-                        cv2.FONT_HERSHEY_SIMPLEX,0.50,UI_DANGER,1,cv2.LINE_AA)
+            (tw,_),_ = _measure(txt2,cv2.FONT_HERSHEY_SIMPLEX,0.50,1)
+            _draw_text(frame,txt2,(w-tw-8,44),
+                       cv2.FONT_HERSHEY_SIMPLEX,0.50,UI_DANGER,1)
 
         # Command toast (right side)
-        if self._cmd_text and time.time()<self._cmd_until:
+        if now is None: now = time.time()
+        if self._cmd_text and now<self._cmd_until:
             font,scale = cv2.FONT_HERSHEY_SIMPLEX,0.50
-            (tw,th),_  = cv2.getTextSize(self._cmd_text,font,scale,1)
+            (tw,th),_  = _measure(self._cmd_text,font,scale,1)
             x = w-tw-14; y = 64
             cv2.rectangle(frame,(x-6,y-th-4),(x+tw+6,y+5),(18,18,28),cv2.FILLED)
             cv2.rectangle(frame,(x-6,y-th-4),(x+tw+6,y+5),(40,200,80),1)
-            cv2.putText(frame,self._cmd_text,(x,y),font,scale,(40,220,100),1,cv2.LINE_AA)
+            _draw_text(frame,self._cmd_text,(x,y),font,scale,(40,220,100),1)
 
 
 class AnchorPulse:
@@ -166,16 +191,9 @@ class AnchorPulse:
         r   = 22
         # Background ring
         cv2.circle(frame,(x,y),r,(40,38,55),2,cv2.LINE_AA)
-        # Progress arc
-        start = -90
-        end   = start + int(progress*360)
-        steps = max(2, int(progress*36))
-        pts   = []
-        for i in range(steps+1):
-            angle = math.radians(start+(end-start)*i/steps)
-            pts.append((int(x+r*math.cos(angle)),int(y+r*math.sin(angle))))
-        for i in range(len(pts)-1):
-            cv2.line(frame,pts[i],pts[i+1],UI_HIGHLIGHT,2,cv2.LINE_AA)
+        # Progress arc, clockwise from 12 o'clock
+        cv2.ellipse(frame,(x,y),(r,r),0.0,-90.0,-90.0+min(progress,1.0)*360.0,
+                    UI_HIGHLIGHT,2,cv2.LINE_AA)
         # Centre dot
         cv2.circle(frame,(x,y),4,UI_HIGHLIGHT if progress>=1.0 else UI_ACCENT,cv2.FILLED)
 
@@ -191,11 +209,12 @@ class TwoHandIndicator:
         self._text  = text
         self._until = time.time() + 1.5
 
-    def draw(self, frame):
-        if not self._text or time.time()>self._until: return
+    def draw(self, frame, now: Optional[float] = None):
+        if now is None: now = time.time()
+        if not self._text or now>self._until: return
         h,w   = frame.shape[:2]
         font,scale = cv2.FONT_HERSHEY_SIMPLEX,0.80
-        (tw,th),_  = cv2.getTextSize(self._text,font,scale,2)
+        (tw,th),_  = _measure(self._text,font,scale,2)
         x = (w-tw)//2; y = h//2
         cv2.rectangle(frame,(x-16,y-th-10),(x+tw+16,y+14),(20,18,32),cv2.FILLED)
         cv2.rectangle(frame,(x-16,y-th-10),(x+tw+16,y+14),UI_HIGHLIGHT,1)
@@ -204,14 +223,12 @@ class TwoHandIndicator:
 
 class FPSDisplay:
     def __init__(self, smoothing=0.92):
-        import time as _time
         self._s   = smoothing
         self._fps = 0.0
-        self._pt  = _time.perf_counter()
+        self._pt  = time.perf_counter()
 
     def tick(self) -> float:
-        import time as _time
-        now = _time.perf_counter()
+        now = time.perf_counter()
         dt  = now - self._pt; self._pt = now
         if dt>0:
             raw      = 1.0/dt
@@ -220,5 +237,4 @@ class FPSDisplay:
 
     def draw(self, frame):
         text = f"FPS {self._fps:.0f}"
-        cv2.putText(frame,text,(12,32),cv2.FONT_HERSHEY_SIMPLEX,0.60,(0,0,0),3,cv2.LINE_AA)
-        cv2.putText(frame,text,(12,32),cv2.FONT_HERSHEY_SIMPLEX,0.60,UI_ACCENT2,1,cv2.LINE_AA)
+        _draw_text(frame,text,(12,32),cv2.FONT_HERSHEY_SIMPLEX,0.60,UI_ACCENT2,1,shadow=(0,0,3))
@@ -35,11 +35,14 @@ MODEL_URL = (
 
 # ── Gesture ───────────────────────────────────────────────────────────────────
 DEBOUNCE_DELAY        = 0.10
+DEBOUNCE_SAMPLES      = 3      # consecutive agreeing raw samples to commit
 CLEAR_HOLD_DURATION   = 0.9
 PINCH_THRESHOLD       = 0.07
 SWIPE_VELOCITY_THRESH = 380
 SWIPE_WINDOW          = 0.28
 EMA_ALPHA             = 0.40
+# Classify both hands on a 2-worker pool when two are visible
+PARALLEL_HAND_CLASSIFY = False
 
 # Toolbar hover-to-activate threshold
 HOVER_ACTIVATE_SEC    = 0.14
@@ -129,6 +132,7 @@ VOICE_LANGUAGE         = "en-US"
 VOICE_ENERGY_THRESHOLD = 280
 VOICE_PAUSE_THRESHOLD  = 0.5
 VOICE_PHRASE_LIMIT     = 5.0
+VOICE_GATE_RATIO       = 0.0    # >0: skip recognition if clip RMS < ratio * energy threshold
 VOICE_BRUSH_STEP       = 5
 VOICE_TOAST_DURATION   = 2.0
 
@@ -153,7 +157,12 @@ AIRCANVAS_API_TIMEOUT_SEC = float(os.getenv("AIRCANVAS_API_TIMEOUT_SEC", "8"))
 FRAME_UPLOAD_QUEUE_SIZE = int(os.getenv("FRAME_UPLOAD_QUEUE_SIZE", "32"))
 FRAME_UPLOAD_RETRY_MAX = int(os.getenv("FRAME_UPLOAD_RETRY_MAX", "3"))
 FRAME_UPLOAD_RETRY_BACKOFF_SEC = float(os.getenv("FRAME_UPLOAD_RETRY_BACKOFF_SEC", "1.4"))
+FRAME_UPLOAD_BATCH_MAX = int(os.getenv("FRAME_UPLOAD_BATCH_MAX", "4"))
+FRAME_UPLOAD_BATCH_LIMIT = 16   # backend rejects larger batches (schemas.py max_length)
 FRAME_PNG_COMPRESSION = int(os.getenv("FRAME_PNG_COMPRESSION", "3"))
+# Full-size frame format: "png" (lossless), "webp" or "jpg" (faster, smaller)
+FRAME_IMAGE_FORMAT = os.getenv("FRAME_IMAGE_FORMAT", "png").strip().lower()
+FRAME_IMAGE_QUALITY = int(os.getenv("FRAME_IMAGE_QUALITY", "90"))
 FRAME_THUMB_MAX_WIDTH = int(os.getenv("FRAME_THUMB_MAX_WIDTH", "420"))
 FRAME_THUMB_JPEG_QUALITY = int(os.getenv("FRAME_THUMB_JPEG_QUALITY", "76"))
 FRAME_UPLOAD_LOCAL_FALLBACK = os.getenv("FRAME_UPLOAD_LOCAL_FALLBACK", "1").strip() in ("1", "true", "True")
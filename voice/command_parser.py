@@ -51,6 +51,9 @@ _TRIGGER_RE = re.compile(
 )
 _CANVAS_STOP_RE = re.compile(r"\b(?:canvas|canva|canvass|campus|cameras?|camvas)\s+stop(?:\s+drawing)?\b")
 _CANVAS_START_RE = re.compile(r"\b(?:canvas|canva|canvass|campus|cameras?|camvas)\s+start\b")
+_STOP_RE = re.compile(r"\bstop\b")
+_WS_RE = re.compile(r"\s+")
+_NUM_RE = re.compile(r"\b(\d+)\b")
 _DIRECT_COMMAND_HINTS = (
     "draw", "shape", "free draw", "freehand",
     "color", "colour", "change", "switch",
@@ -79,6 +82,56 @@ _COLORS = {
     "purple":"color_purple","orange":"color_orange","white":"color_white",
 }
 
+# Keyword -> table position; when several match, the earlier entry wins
+_SHAPE_RANK = {k: i for i, k in enumerate(_SHAPES)}
+_COLOR_RANK = {k: i for i, k in enumerate(_COLORS)}
+
+# ── Keyword groups ────────────────────────────────────────────────────────────
+# Matched as substrings of the utterance, same as the old `k in text` checks.
+_SHAPE_KW      = frozenset(("draw", "shape"))
+_FREE_DRAW_KW  = frozenset(("free draw", "freehand", "free mode", "freestyle"))
+_CONFIRM_KW    = frozenset(("confirm", "done", "finish", "finalize", "complete"))
+_COLOR_KW      = frozenset(("color", "colour", "change", "switch"))
+_BRUSH_KW      = frozenset(("brush", "size", "thickness", "stroke"))
+_BRUSH_SET_KW  = frozenset(("set", "to", "size", "thickness"))
+_BRUSH_UP_KW   = frozenset(("increase", "bigger", "larger", "up", "more", "thicker"))
+_BRUSH_DOWN_KW = frozenset(("decrease", "smaller", "reduce", "down", "less", "thinner"))
+_SLIDE_MODE_KW = frozenset(("slide mode", "presentation", "slideshow"))
+_DRAW_MODE_KW  = frozenset(("draw mode", "drawing mode", "back to draw"))
+_NEXT_KW       = frozenset(("next slide", "next", "forward"))
+_PREV_KW       = frozenset(("previous", "prev slide", "back", "previous slide"))
+_CLEAR_KW      = frozenset(("clear", "wipe", "erase all", "reset"))
+_SAVE_KW       = frozenset(("save", "export", "store"))
+_PAUSE_KW      = frozenset(("pause", "freeze", "hold"))
+_RESUME_KW     = frozenset(("resume", "continue", "unpause", "start"))
+_IMPORT_KW     = frozenset(("import", "load image", "open image", "add image", "add photo"))
+_GRID_KW       = frozenset(("grid", "snap", "guide"))
+
+_KEYWORDS = frozenset().union(
+    _DIRECT_COMMAND_HINTS, _SHAPES, _COLORS, ("undo", "redo"),
+    _SHAPE_KW, _FREE_DRAW_KW, _CONFIRM_KW, _COLOR_KW,
+    _BRUSH_KW, _BRUSH_SET_KW, _BRUSH_UP_KW, _BRUSH_DOWN_KW,
+    _SLIDE_MODE_KW, _DRAW_MODE_KW, _NEXT_KW, _PREV_KW,
+    _CLEAR_KW, _SAVE_KW, _PAUSE_KW, _RESUME_KW, _IMPORT_KW, _GRID_KW,
+)
+
+# One pass over the text: the lookahead tries every offset and, with the
+# alternation ordered longest-first, reports the longest keyword starting
+# there. Any shorter keyword at that offset (or inside it) is a substring of
+# that match, so each match expands to its precomputed substring closure.
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_KEYWORDS, key=len, reverse=True)) + "))"
+)
+_KEYWORD_CLOSURE = {k: frozenset(j for j in _KEYWORDS if j in k) for k in _KEYWORDS}
+
+
+def _keyword_hits(text: str) -> frozenset[str]:
+    """Every keyword that occurs in `text` as a substring."""
+    hits: set[str] = set()
+    for m in _KEYWORD_RE.finditer(text):
+        hits |= _KEYWORD_CLOSURE[m.group(1)]
+    return frozenset(hits)
+
 
 class CommandParser:
 
@@ -97,95 +150,95 @@ class CommandParser:
             return VoiceCommand(CommandType.STOP, raw=text)
 
         cleaned, had_trigger = self._strip_trigger(text)
-        if not had_trigger and not self._looks_like_direct_command(text):
+        command = cleaned if had_trigger else text
+        hits = _keyword_hits(command)
+        if not had_trigger and hits.isdisjoint(_DIRECT_COMMAND_HINTS):
             return None
 
-        cmd = self._parse_command(cleaned if had_trigger else text)
+        cmd = self._parse_command(command, hits)
         if cmd:
             cmd.raw = text
             return cmd
         return VoiceCommand(CommandType.UNKNOWN, raw=text) if had_trigger else None
 
     def _is_stop(self, t):
-        return re.search(r"\bstop\b", t) is not None
+        return _STOP_RE.search(t) is not None
 
     def _strip_trigger(self, text: str) -> tuple[str, bool]:
         cleaned = _TRIGGER_RE.sub(" ", text)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip(" ,.")
+        cleaned = _WS_RE.sub(" ", cleaned).strip(" ,.")
         return cleaned, cleaned != text
 
-    @staticmethod
-    def _looks_like_direct_command(text: str) -> bool:
-        return any(k in text for k in _DIRECT_COMMAND_HINTS)
-
-    def _parse_command(self, text: str) -> Optional[VoiceCommand]:
+    def _parse_command(self, text: str, hits: frozenset[str]) -> Optional[VoiceCommand]:
         return (
-            self._draw_shape(text) or
-            self._free_draw(text) or
-            self._confirm(text) or
-            self._color(text) or
-            self._brush(text) or
-            self._slides(text) or
-            self._system(text)
+            self._draw_shape(hits) or
+            self._free_draw(hits) or
+            self._confirm(hits) or
+            self._color(hits) or
+            self._brush(text, hits) or
+            self._slides(hits) or
+            self._system(hits)
         )
 
-    def _draw_shape(self, t):
-        if "draw" not in t and "shape" not in t: return None
-        for k,v in _SHAPES.items():
-            if k in t: return VoiceCommand(CommandType.DRAW_SHAPE, {"shape":v})
-        return None
+    def _draw_shape(self, hits):
+        if hits.isdisjoint(_SHAPE_KW): return None
+        found = hits & _SHAPE_RANK.keys()
+        if not found: return None
+        k = min(found, key=_SHAPE_RANK.__getitem__)
+        return VoiceCommand(CommandType.DRAW_SHAPE, {"shape":_SHAPES[k]})
 
-    def _free_draw(self, t):
-        if any(k in t for k in ("free draw","freehand","free mode","freestyle")):
+    def _free_draw(self, hits):
+        if not hits.isdisjoint(_FREE_DRAW_KW):
             return VoiceCommand(CommandType.FREE_DRAW)
         return None
 
-    def _confirm(self, t):
-        if any(k in t for k in ("confirm","done","finish","finalize","complete")):
+    def _confirm(self, hits):
+        if not hits.isdisjoint(_CONFIRM_KW):
             return VoiceCommand(CommandType.CONFIRM_SHAPE)
         return None
 
-    def _color(self, t):
-        if not any(k in t for k in ("color","colour","change","switch")): return None
-        for k,v in _COLORS.items():
-            if k in t: return VoiceCommand(CommandType.SET_COLOR, {"action":v})
-        return None
-
-    def _brush(self, t):
-        if not any(k in t for k in ("brush","size","thickness","stroke")): return None
-        m = re.search(r"\b(\d+)\b", t)
-        if m and any(k in t for k in ("set", "to", "size", "thickness")):
+    def _color(self, hits):
+        if hits.isdisjoint(_COLOR_KW): return None
+        found = hits & _COLOR_RANK.keys()
+        if not found: return None
+        k = min(found, key=_COLOR_RANK.__getitem__)
+        return VoiceCommand(CommandType.SET_COLOR, {"action":_COLORS[k]})
+
+    def _brush(self, t, hits):
+        if hits.isdisjoint(_BRUSH_KW): return None
+        m = _NUM_RE.search(t)
+        if m and not hits.isdisjoint(_BRUSH_SET_KW):
             return VoiceCommand(CommandType.BRUSH_SET, {"size": int(m.group(1))})
-        if any(k in t for k in ("increase","bigger","larger","up","more","thicker")):
+        if not hits.isdisjoint(_BRUSH_UP_KW):
             return VoiceCommand(CommandType.BRUSH_UP)
-        if any(k in t for k in ("decrease","smaller","reduce","down","less","thinner")):
+        if not hits.isdisjoint(_BRUSH_DOWN_KW):
             return VoiceCommand(CommandType.BRUSH_DOWN)
         return None
 
-    def _slides(self, t):
-        if any(k in t for k in ("slide mode","presentation","slideshow")):
+    def _slides(self, hits):
+        if not hits.isdisjoint(_SLIDE_MODE_KW):
             return VoiceCommand(CommandType.SLIDE_MODE)
-        if any(k in t for k in ("draw mode","drawing mode","back to draw")):
+        if not hits.isdisjoint(_DRAW_MODE_KW):
             return VoiceCommand(CommandType.DRAW_MODE)
-        if any(k in t for k in ("next slide","next","forward")):
+        if not hits.isdisjoint(_NEXT_KW):
             return VoiceCommand(CommandType.NEXT_SLIDE)
-        if any(k in t for k in ("previous","prev slide","back","previous slide")):
+        if not hits.isdisjoint(_PREV_KW):
             return VoiceCommand(CommandType.PREV_SLIDE)
         return None
 
-    def _system(self, t):
-        if any(k in t for k in ("clear","wipe","erase all","reset")):
+    def _system(self, hits):
+        if not hits.isdisjoint(_CLEAR_KW):
             return VoiceCommand(CommandType.CLEAR)
-        if any(k in t for k in ("save","export","store")):
+        if not hits.isdisjoint(_SAVE_KW):
             return VoiceCommand(CommandType.SAVE)
-        if any(k in t for k in ("pause","freeze","hold")):
+        if not hits.isdisjoint(_PAUSE_KW):
             return VoiceCommand(CommandType.PAUSE)
-        if any(k in t for k in ("resume","continue","unpause","start")):
+        if not hits.isdisjoint(_RESUME_KW):
             return VoiceCommand(CommandType.RESUME)
-        if "undo" in t: return VoiceCommand(CommandType.UNDO)
-        if "redo" in t: return VoiceCommand(CommandType.REDO)
-        if any(k in t for k in ("import","load image","open image","add image","add photo")):
+        if "undo" in hits: return VoiceCommand(CommandType.UNDO)
+        if "redo" in hits: return VoiceCommand(CommandType.REDO)
+        if not hits.isdisjoint(_IMPORT_KW):
             return VoiceCommand(CommandType.IMPORT_IMAGE)
-        if any(k in t for k in ("grid","snap","guide")):
+        if not hits.isdisjoint(_GRID_KW):
             return VoiceCommand(CommandType.GRID_TOGGLE)
         return None
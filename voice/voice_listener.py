@@ -10,11 +10,15 @@ Robust threaded voice listener with:
 
 from __future__ import annotations
 
-import queue
 import threading
 import time
+from collections import deque
 from typing import Optional
 
+import numpy as np
+
+from performance._jit import frame_energy
+
 try:
     import speech_recognition as sr
     _SR_AVAILABLE = True
@@ -30,12 +34,17 @@ class VoiceListener:
         energy_threshold: int   = 280,
         pause_threshold:  float = 0.5,
         phrase_limit:     float = 5.0,
+        gate_ratio:       float = 0.0,
     ) -> None:
         self._lang        = language
         self._energy      = energy_threshold
         self._pause       = pause_threshold
         self._phrase_lim  = phrase_limit
-        self._queue: queue.Queue[str] = queue.Queue(maxsize=30)
+        self._gate_ratio  = gate_ratio
+        # Single producer (listener thread), single consumer (render loop):
+        # deque append/popleft are atomic under the GIL, so no lock is taken.
+        self._queue: deque[str] = deque()
+        self._queue_max   = 30
         self._running     = False
         self._thread: Optional[threading.Thread] = None
         self._available   = _SR_AVAILABLE
@@ -79,10 +88,32 @@ class VoiceListener:
 
     def get_text(self) -> Optional[str]:
         try:
-            return self._queue.get_nowait()
-        except queue.Empty:
+            return self._queue.popleft()
+        except IndexError:
             return None
 
+    def drain(self) -> list[str]:
+        """All pending utterances, oldest first; an empty list costs one length check."""
+        q = self._queue
+        if not q:
+            return []
+        items = []
+        while q:
+            items.append(q.popleft())
+        return items
+
+    def _loud_enough(self, audio, threshold: float) -> bool:
+        """
+        Optional local energy gate: skip the network round trip on near-silence.
+        Off unless gate_ratio > 0; the clip includes listen()'s silence padding,
+        so a high ratio drops quiet but valid commands.
+        """
+        if self._gate_ratio <= 0.0:
+            return True
+        samples = np.frombuffer(audio.get_raw_data(convert_width=2), dtype=np.int16)
+        gate = self._gate_ratio * threshold
+        return frame_energy(samples) >= gate * gate
+
     def _loop(self) -> None:
         rec = sr.Recognizer()
         rec.energy_threshold        = self._energy
@@ -108,10 +139,12 @@ class VoiceListener:
             try:
                 with mic as src:
                     audio = rec.listen(src, timeout=2.0, phrase_time_limit=self._phrase_lim)
+                if not self._loud_enough(audio, rec.energy_threshold):
+                    continue
                 try:
                     text = rec.recognize_google(audio, language=self._lang).lower().strip()
-                    if text and not self._queue.full():
-                        self._queue.put_nowait(text)
+                    if text and len(self._queue) < self._queue_max:
+                        self._queue.append(text)
                         print(f"[VOICE] '{text}'")
                 except sr.UnknownValueError:
                     pass